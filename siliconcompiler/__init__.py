@@ -3,25 +3,44 @@ from siliconcompiler._common import NodeStatus
 from siliconcompiler.utils import sc_open
 from siliconcompiler._metadata import version as __version__
 
-# User classes
-from siliconcompiler.design import Design
-from siliconcompiler.pdk import PDK
-from siliconcompiler.flowgraph import Flowgraph
-from siliconcompiler.checklist import Checklist
-from siliconcompiler.library import StdCellLibrary
-from siliconcompiler.schematic import Schematic
-
-# Tasks
-from siliconcompiler.tool import Task, ShowTask, ScreenshotTask, TaskSkip
-
-# Projects
-from siliconcompiler.project import Project
-from siliconcompiler.asic import ASIC
-from siliconcompiler.fpga import FPGA
-from siliconcompiler.project import Lint
-from siliconcompiler.project import Sim
-
-from siliconcompiler.fpga import FPGADevice
+# Classes are imported on first access (PEP 562) to keep the package import light
+_LAZY_IMPORTS = {
+    # User classes
+    "Design": "siliconcompiler.design",
+    "PDK": "siliconcompiler.pdk",
+    "Flowgraph": "siliconcompiler.flowgraph",
+    "Checklist": "siliconcompiler.checklist",
+    "StdCellLibrary": "siliconcompiler.library",
+    "Schematic": "siliconcompiler.schematic",
+
+    # Tasks
+    "Task": "siliconcompiler.tool",
+    "ShowTask": "siliconcompiler.tool",
+    "ScreenshotTask": "siliconcompiler.tool",
+    "TaskSkip": "siliconcompiler.tool",
+
+    # Projects
+    "Project": "siliconcompiler.project",
+    "ASIC": "siliconcompiler.asic",
+    "FPGA": "siliconcompiler.fpga",
+    "Lint": "siliconcompiler.project",
+    "Sim": "siliconcompiler.project",
+
+    "FPGADevice": "siliconcompiler.fpga"
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 __all__ = [
@@ -29,7 +29,7 @@ from importlib.metadata import distributions, distribution
 from pathlib import Path
 from urllib import parse as url_parse
 
-from siliconcompiler.utils import get_plugins
+from siliconcompiler.utils import default_cache_dir, get_plugins
 
 if TYPE_CHECKING:
     from siliconcompiler.project import Project
@@ -72,11 +72,8 @@ class Resolver:
         self.__reference = reference
         self.__changed = False
         self.__cacheid = None
-
-        if self.__root and hasattr(self.__root, "logger"):
-            self.__logger = self.__root.logger.getChild(f"resolver-{self.name}")
-        else:
-            self.__logger = logging.getLogger(f"resolver-{self.name}")
+        self.__urlparse = None
+        self.__logger = None
 
     @staticmethod
     def populate_resolvers() -> None:
@@ -88,17 +85,18 @@ class Resolver:
         by external plugins.
         """
         with Resolver._RESOLVERS_LOCK:
-            Resolver._RESOLVERS.clear()
-
-            Resolver._RESOLVERS.update({
+            resolvers = {
                 "": FileResolver,
                 "file": FileResolver,
                 "key": KeyPathResolver,
                 "python": PythonPathResolver
-            })
+            }
 
             for resolver in get_plugins("path_resolver"):
-                Resolver._RESOLVERS.update(resolver())
+                resolvers.update(resolver())
+
+            # Swap in the complete mapping so lookups never see a partial registry
+            Resolver._RESOLVERS = resolvers
 
     @staticmethod
     def find_resolver(source: str) -> Type["Resolver"]:
@@ -117,15 +115,15 @@ class Resolver:
         if os.path.isabs(source):
             return FileResolver
 
-        if not Resolver._RESOLVERS:
+        resolvers = Resolver._RESOLVERS
+        if not resolvers:
             Resolver.populate_resolvers()
+            resolvers = Resolver._RESOLVERS
 
-        url = url_parse.urlparse(source)
-        with Resolver._RESOLVERS_LOCK:
-            if url.scheme in Resolver._RESOLVERS:
-                return Resolver._RESOLVERS[url.scheme]
-
-        raise ValueError(f"Source URI '{source}' is not supported")
+        try:
+            return resolvers[url_parse.urlparse(source).scheme]
+        except KeyError:
+            raise ValueError(f"Source URI '{source}' is not supported") from None
 
     @property
     def name(self) -> str:
@@ -140,6 +138,12 @@ class Resolver:
     @property
     def logger(self) -> logging.Logger:
         """The logger instance for this resolver."""
+        if self.__logger is None:
+            # Created on first use, most resolvers are only used to look up cached paths
+            if self.__root and hasattr(self.__root, "logger"):
+                self.__logger = self.__root.logger.getChild(f"resolver-{self.name}")
+            else:
+                self.__logger = logging.getLogger(f"resolver-{self.name}")
         return self.__logger
 
     @property
@@ -155,7 +159,14 @@ class Resolver:
     @property
     def urlparse(self) -> url_parse.ParseResult:
         """The parsed URL of the source after environment variable expansion."""
-        return url_parse.urlparse(self.__resolve_env(self.source))
+        if self.__urlparse is not None:
+            return self.__urlparse
+
+        urlparse = url_parse.urlparse(self.__resolve_env(self.source))
+        if not any(c in self.source for c in "$%~"):
+            # Nothing to expand, so the parsed URL can never change
+            self.__urlparse = urlparse
+        return urlparse
 
     @property
     def urlscheme(self) -> str:
@@ -182,16 +193,17 @@ class Resolver:
     def cache_id(self) -> str:
         """A unique ID for this resolver instance, used for caching."""
         if self.__cacheid is None:
-            hash_obj = hashlib.sha1()
-            hash_obj.update(self.__source.encode())
-            if self.__reference:
-                hash_obj.update(self.__reference.encode())
-            else:
-                hash_obj.update("".encode())
-
-            self.__cacheid = hash_obj.hexdigest()
+            self.__cacheid = Resolver.__compute_cache_id(self.__source, self.__reference)
         return self.__cacheid
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def __compute_cache_id(source: str, reference: Optional[str]) -> str:
+        """Hashes a source and reference, shared by resolvers of the same data."""
+        # The id also names the on-disk cache directories, so the digest must stay stable
+        payload = source + (reference or "")
+        return hashlib.sha1(payload.encode(), usedforsecurity=False).hexdigest()
+
     def set_changed(self):
         """Marks the resolved data as having been changed."""
         self.__changed = True
@@ -208,9 +220,13 @@ class Resolver:
     @staticmethod
     def __get_root_id(root: Union["Project", "BaseSchema"]) -> str:
         """Generates or retrieves a unique ID for a root object."""
-        if not getattr(root, Resolver.__STORAGE, None):
-            setattr(root, Resolver.__STORAGE, uuid.uuid4().hex)
-        return getattr(root, Resolver.__STORAGE)
+        # Access the instance dict directly to skip the attribute lookup machinery
+        root_attrs = root.__dict__
+        root_id = root_attrs.get(Resolver.__STORAGE)
+        if not root_id:
+            root_id = uuid.uuid4().hex
+            root_attrs[Resolver.__STORAGE] = root_id
+        return root_id
 
     @staticmethod
     def get_cache(root: Optional[Union["Project", "BaseSchema"]], name: Optional[str] = None) \
@@ -230,14 +246,12 @@ class Resolver:
             return None
 
         with Resolver.__CACHE_LOCK:
-            root_id = Resolver.__get_root_id(root)
-            if root_id not in Resolver.__CACHE:
-                Resolver.__CACHE[root_id] = {}
+            cache = Resolver.__CACHE.setdefault(Resolver.__get_root_id(root), {})
 
             if name:
-                return Resolver.__CACHE[root_id].get(name, None)
+                return cache.get(name, None)
 
-            return Resolver.__CACHE[root_id].copy()
+            return cache.copy()
 
     @staticmethod
     def set_cache(root: Optional[Union["Project", "BaseSchema"]],
@@ -255,10 +269,7 @@ class Resolver:
             return
 
         with Resolver.__CACHE_LOCK:
-            root_id = Resolver.__get_root_id(root)
-            if root_id not in Resolver.__CACHE:
-                Resolver.__CACHE[root_id] = {}
-            Resolver.__CACHE[root_id][name] = str(path)
+            Resolver.__CACHE.setdefault(Resolver.__get_root_id(root), {})[name] = str(path)
 
     @staticmethod
     def reset_cache(root: Optional[Union["Project", "BaseSchema"]]) -> None:
@@ -307,19 +318,23 @@ class Resolver:
 
     def __resolve_env(self, path: str) -> str:
         """Expands environment variables and user home directory in a path."""
-        env_save = os.environ.copy()
-
-        if self.root:
+        if "$" in path or (os.name == "nt" and "%" in path):
             schema_env = {}
-            if self.root.valid("option", "env"):
+            if self.root and self.root.valid("option", "env"):
                 for env in self.root.getkeys('option', 'env'):
                     schema_env[env] = self.root.get('option', 'env', env)
-            os.environ.update(schema_env)
 
-        path = os.path.expandvars(path)
-        path = os.path.expanduser(path)
-        os.environ.clear()
-        os.environ.update(env_save)
+            if schema_env:
+                env_save = os.environ.copy()
+                os.environ.update(schema_env)
+                path = os.path.expandvars(path)
+                os.environ.clear()
+                os.environ.update(env_save)
+            else:
+                path = os.path.expandvars(path)
+
+        if path.startswith("~"):
+            path = os.path.expanduser(path)
         return path
 
 
@@ -347,6 +362,11 @@ class RemoteResolver(Resolver):
         # Wait a maximum of 10 minutes for other processes to finish
         self.__max_lock_wait: int = 60 * 10
 
+        self.__cache_name: Optional[str] = None
+
+        # Last cache directory known to exist
+        self.__created_cache_dir: Optional[Path] = None
+
     @property
     def timeout(self) -> int:
         """The maximum time in seconds to wait for a lock."""
@@ -370,12 +390,8 @@ class RemoteResolver(Resolver):
         Returns:
             Path: The path to the cache directory.
         """
-        default_path = os.path.join(Path.home(), '.sc', 'cache')
-        if not root:
-            return Path(default_path)
-
         path = None
-        if root.valid('option', 'cachedir'):
+        if root and root.valid('option', 'cachedir'):
             path = root.get('option', 'cachedir')
             if path:
                 path = root.find_files('option', 'cachedir', missing_ok=True)
@@ -383,7 +399,7 @@ class RemoteResolver(Resolver):
                     path = os.path.join(getattr(root, "_Project__cwd", os.getcwd()),
                                         root.get('option', 'cachedir'))
         if not path:
-            path = default_path
+            path = default_cache_dir()
 
         return Path(path)
 
@@ -395,36 +411,35 @@ class RemoteResolver(Resolver):
     @property
     def cache_name(self) -> str:
         """A unique name for the cached data directory."""
-        return f"{self.name}-{self.reference[0:16]}-{self.cache_id[0:16]}"
+        if self.__cache_name is None:
+            self.__cache_name = f"{self.name}-{self.reference[0:16]}-{self.cache_id[0:16]}"
+        return self.__cache_name
+
+    def __make_cache_dir(self) -> Path:
+        """Returns the cache directory, creating it the first time it is used."""
+        cache_dir = self.cache_dir
+        if cache_dir != self.__created_cache_dir:
+            if not os.path.exists(cache_dir):
+                os.makedirs(cache_dir, exist_ok=True)
+            self.__created_cache_dir = cache_dir
+        return cache_dir
 
     @property
     def cache_path(self) -> Path:
         """The full path to the cached data directory."""
-        cache_dir = self.cache_dir
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir, exist_ok=True)
-
-        return self.cache_dir / self.cache_name
+        return self.__make_cache_dir() / self.cache_name
 
     @property
     def lock_file(self) -> Path:
         """The path to the file used for inter-process locking."""
-        cache_dir = self.cache_dir
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir, exist_ok=True)
-
-        return self.cache_dir / f"{self.cache_name}.lock"
+        return self.__make_cache_dir() / f"{self.cache_name}.lock"
 
     @property
     def sc_lock_file(self) -> Path:
         """
         The path to a secondary lock file used as a fallback mechanism.
         """
-        cache_dir = self.cache_dir
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir, exist_ok=True)
-
-        return self.cache_dir / f"{self.cache_name}.sc_lock"
+        return self.__make_cache_dir() / f"{self.cache_name}.sc_lock"
 
     def thread_lock(self) -> threading.Lock:
         """Gets a threading.Lock specific to this resolver instance."""
@@ -469,13 +484,17 @@ class RemoteResolver(Resolver):
             except (OSError, RuntimeError):
                 if not lock_acquired:
                     sc_data_path_lock = Path(self.sc_lock_file)
-                    max_seconds = self.timeout
+                    # Poll quickly at first and back off for long waits
+                    remaining = self.timeout
+                    delay = 0.1
                     while sc_data_path_lock.exists():
-                        if max_seconds == 0:
+                        if remaining <= 0:
                             raise RuntimeError(f'Failed to access {self.cache_path}. '
                                                f'Lock {sc_data_path_lock} still exists.')
-                        time.sleep(1)
-                        max_seconds -= 1
+                        delay = min(delay, remaining)
+                        time.sleep(delay)
+                        remaining -= delay
+                        delay = min(2 * delay, 5)
                     sc_data_path_lock.touch()
                     lock_acquired = True
             if lock_acquired:
@@ -535,7 +554,7 @@ class RemoteResolver(Resolver):
                 # Can't create directory, return path and let it fail later
                 return self.cache_path
 
-        if not os.access(self.cache_dir, os.W_OK):
+        if not os.access(cache_dir, os.W_OK):
             # Can't write to directory, assume cache is valid if it exists
             return self.cache_path
 
@@ -2,6 +2,8 @@
 A collection of functions for creating and managing interactive metric graphs
 in the web dashboard using Streamlit and Altair.
 """
+import weakref
+
 import altair
 import streamlit
 
@@ -9,6 +11,10 @@ from siliconcompiler.report import report
 
 from siliconcompiler.report.dashboard.web import state
 
+# Projects are replaced rather than modified when the manifest is reloaded,
+# so the chart data collected for a project object stays valid while it lives
+_CHART_DATA = weakref.WeakKeyDictionary()
+
 
 def _get_report_projects():
     """
@@ -16,11 +22,20 @@ def _get_report_projects():
 
     Returns:
         list[dict]: A list of dictionaries, where each dictionary contains
-                    'project_object' and 'project_name'.
+                    'project_object', 'project_name' and 'chart_data'.
     """
     projects = []
     for job in state.get_projects():
-        projects.append({'project_object': state.get_project(job), 'project_name': job})
+        project = state.get_project(job)
+        chart_data = _CHART_DATA.get(project)
+        if chart_data is None:
+            chart_data = report.collect_chart_data(project)
+            _CHART_DATA[project] = chart_data
+        projects.append({
+            'project_object': project,
+            'project_name': job,
+            'chart_data': chart_data
+        })
     return projects
 
 
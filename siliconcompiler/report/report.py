@@ -1,11 +1,19 @@
 import fnmatch
 import os
+import re
 from siliconcompiler.schema import PerNode, Parameter
 from siliconcompiler.report import utils
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 
 from siliconcompiler.utils.paths import workdir
 
+# pandas is expensive to import, so it is resolved on first use
+_DataFrame = None
+
+# raw schema values used when simplifying manifest leaves
+_PERNODE_NEVER = PerNode.NEVER.value
+_GLOBAL_KEY = Parameter.GLOBAL_KEY
+
 
 def make_metric_dataframe(project):
     '''
@@ -21,15 +29,20 @@ def make_metric_dataframe(project):
         >>> make_metric_dataframe(project)
         Returns pandas dataframe of tracked metrics.
     '''
-    from pandas import DataFrame
+    global _DataFrame
+    if _DataFrame is None:
+        from pandas import DataFrame as _DataFrame
 
     _, _, metrics, metrics_unit, metrics_to_show, _ = utils._collect_data(project)
-    # converts from 2d dictionary to pandas DataFrame, transposes so
-    # orientation is correct, and filters based on the metrics we track
-    data = (DataFrame.from_dict(metrics, orient='index').transpose())
-    data = data.loc[metrics_to_show]
+    # builds the DataFrame one node column at a time, only keeping the
+    # metrics we track, so no transpose or filtering is needed
+    data = _DataFrame(
+        {node: [node_metrics[metric] for metric in metrics_to_show]
+         for node, node_metrics in metrics.items()},
+        index=metrics_to_show,
+        dtype=object)
     # include metrics_unit
-    data.index = data.index.map(lambda x: (x, metrics_unit[x]))
+    data.index = [metrics_to_show, [metrics_unit[metric] for metric in metrics_to_show]]
     return data
 
 
@@ -59,17 +72,12 @@ def get_flowgraph_nodes(project, step, index):
         nodes['tool'] = tool
     if task is not None:
         nodes['task'] = task
-    for key in project.getkeys('record'):
-        if project.get('record', key, field='pernode').is_never():
-            value = project.get('record', key)
-        else:
-            value = project.get('record', key, step=step, index=index)
-        if value is not None:
-            if key == 'inputnode':
-                value = ", ".join([f'{step}/{index}' for step, index in value])
-            if key == 'pythonpackage':
-                value = ", ".join(value)
-            nodes[key] = str(value)
+    for key, value in utils._get_node_records(project, step, index).items():
+        if key == 'inputnode':
+            value = ", ".join([f'{step}/{index}' for step, index in value])
+        if key == 'pythonpackage':
+            value = ", ".join(value)
+        nodes[key] = str(value)
     return nodes
 
 
@@ -89,14 +97,46 @@ def get_flowgraph_edges(project):
     '''
     flowgraph_edges = {}
     flow = project.get('option', 'flow')
-    for step in project.getkeys('flowgraph', flow):
-        for index in project.getkeys('flowgraph', flow, step):
-            flowgraph_edges[step, index] = set()
-            for in_step, in_index in project.get('flowgraph', flow, step, index, 'input'):
-                flowgraph_edges[step, index].add((in_step, in_index))
+    flowgraph = project.get('flowgraph', flow, field='schema')
+    for step in flowgraph.getkeys():
+        for index in flowgraph.getkeys(step):
+            flowgraph_edges[step, index] = set(flowgraph.get(step, index, 'input'))
     return flowgraph_edges
 
 
+def _expand_leaf(nodes, pernode):
+    '''
+    Simplifies the node values of a manifest leaf.
+
+    Args:
+        nodes (dict) : The 'node' section of the leaf.
+        pernode (str) : The raw 'pernode' value of the leaf.
+
+    Returns:
+        The value of the leaf if it is never set per node, otherwise a
+        dictionary of the values that are set, keyed by node.
+    '''
+    if pernode == _PERNODE_NEVER:
+        if _GLOBAL_KEY in nodes and _GLOBAL_KEY in nodes[_GLOBAL_KEY]:
+            return nodes[_GLOBAL_KEY][_GLOBAL_KEY]['value']
+        return nodes['default']['default']['value']
+
+    node_values = {}
+    for step in nodes:
+        if step == 'default' or step == _GLOBAL_KEY:
+            node_values[step] = nodes[step][step]['value']
+        else:
+            for index in nodes[step]:
+                value = nodes[step][index]['value']
+                if value is None:
+                    continue
+                if index == 'default' or index == _GLOBAL_KEY:
+                    node_values[step] = value
+                else:
+                    node_values[f'{step}/{index}'] = value
+    return node_values
+
+
 def make_manifest_helper(manifest_subsect, modified_manifest_subsect):
     '''
     Function is a helper function to make_manifest. It mutates the input json.
@@ -112,70 +152,29 @@ def make_manifest_helper(manifest_subsect, modified_manifest_subsect):
         'default' nodes.
     '''
 
-    def _is_leaf(cfg):
-        # 'shorthelp' chosen arbitrarily: any mandatory field with a consistent
-        # type would work.
-        return 'type' in cfg and isinstance(cfg['type'], str)
-
-    def build_leaf(manifest_subsect):
-        nodes = manifest_subsect['node']
-        if PerNode(manifest_subsect['pernode']) == PerNode.NEVER:
-            if Parameter.GLOBAL_KEY in nodes and \
-                    Parameter.GLOBAL_KEY in nodes[Parameter.GLOBAL_KEY]:
-                value = nodes[Parameter.GLOBAL_KEY][Parameter.GLOBAL_KEY]['value']
-            else:
-                value = nodes['default']['default']['value']
-            return value
-        else:
-            node_values = {}
-            for step in nodes:
-                if step == 'default' or step == Parameter.GLOBAL_KEY:
-                    value = nodes[step][step]['value']
-                    node_values[step] = value
-                else:
-                    for index in nodes[step]:
-                        value = nodes[step][index]['value']
-                        if value is None:
-                            continue
-                        if index == 'default' or index == Parameter.GLOBAL_KEY:
-                            node_values[step] = value
-                        else:
-                            node_values[step + index] = value
-            return node_values
-
-    if _is_leaf(manifest_subsect):
-        nodes = manifest_subsect['node']
-        if PerNode(manifest_subsect['pernode']) == PerNode.NEVER:
-            if Parameter.GLOBAL_KEY in nodes:
-                value = nodes[Parameter.GLOBAL_KEY][Parameter.GLOBAL_KEY]['value']
-            else:
-                value = nodes['default']['default']['value']
+    # 'type' chosen arbitrarily to identify leaves: any mandatory field with a
+    # consistent type would work.
+    if 'type' in manifest_subsect and isinstance(manifest_subsect['type'], str):
+        pernode = manifest_subsect['pernode']
+        value = _expand_leaf(manifest_subsect['node'], pernode)
+        if pernode == _PERNODE_NEVER:
             modified_manifest_subsect['value'] = value
         else:
-            for step in nodes:
-                if step == 'default' or step == Parameter.GLOBAL_KEY:
-                    value = nodes[step][step]['value']
-                    modified_manifest_subsect[step] = value
-                else:
-                    for index in nodes[step]:
-                        value = nodes[step][index]['value']
-                        if value is None:
-                            continue
-                        if index == 'default' or index == Parameter.GLOBAL_KEY:
-                            modified_manifest_subsect[step] = value
-                        else:
-                            modified_manifest_subsect[step + index] = value
-
-    for key, key_dict in sorted(manifest_subsect.items(), key=lambda k: k[0]):
-        if key == "__meta__" or key == "__journal__":
-            continue
+            modified_manifest_subsect.update(value)
 
-        if key != 'default':
-            if _is_leaf(key_dict):
-                modified_manifest_subsect[key] = build_leaf(key_dict)
+    stack = [(manifest_subsect, modified_manifest_subsect)]
+    while stack:
+        src, dst = stack.pop()
+        for key in sorted(src):
+            if key == "__meta__" or key == "__journal__" or key == 'default':
+                continue
+
+            key_dict = src[key]
+            if 'type' in key_dict and isinstance(key_dict['type'], str):
+                dst[key] = _expand_leaf(key_dict['node'], key_dict['pernode'])
             else:
-                modified_manifest_subsect[key] = {}
-                make_manifest_helper(key_dict, modified_manifest_subsect[key])
+                dst[key] = {}
+                stack.append((key_dict, dst[key]))
 
 
 def make_manifest(project):
@@ -215,50 +214,69 @@ def get_flowgraph_path(project):
     return utils._get_flowgraph_path(project, flow, runtime.get_nodes())
 
 
-def search_manifest_keys(manifest, key):
+def _compile_search(pattern):
+    '''
+    Returns a match function for the glob pattern, so the pattern is only
+    translated once per search. Like fnmatch.fnmatch, names are normalized
+    with os.path.normcase, so matching is case insensitive on Windows.
+
+    Args:
+        pattern (string) : Glob style pattern to match against.
+    '''
+    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    if os.name != 'nt':
+        # normcase does nothing outside of Windows
+        return match
+    return lambda name: match(os.path.normcase(name))
+
+
+def search_manifest_keys(manifest, key_match):
     '''
     Function is a recursive helper to search_manifest, more info there.
 
     Args:
         manifest (dictionary) : A dictionary representing the manifest.
-        key (string) : Searches all keys for partial matches on this string.
+        key_match (function) : Compiled pattern match function, used to search
+            all keys for partial matches.
     '''
     filtered_manifest = {}
     for dict_key in manifest:
-        if fnmatch.fnmatch(dict_key, key):
+        if key_match(dict_key):
             filtered_manifest[dict_key] = manifest[dict_key]
         elif isinstance(manifest[dict_key], dict):
-            result = search_manifest_keys(manifest[dict_key], key)
+            result = search_manifest_keys(manifest[dict_key], key_match)
             if result:  # result is non-empty
                 filtered_manifest[dict_key] = result
     return filtered_manifest
 
 
-def search_manifest_values(manifest, value):
+def search_manifest_values(manifest, value_match):
     '''
     Function is a recursive helper to search_manifest, more info there.
 
     Args:
         manifest (dictionary) : A dictionary representing the manifest.
-        value (string) : Searches all values for partial matches on this
-            string.
+        value_match (function) : Compiled pattern match function, used to
+            search all values for partial matches.
     '''
     filtered_manifest = {}
-    for key in manifest:
-        if isinstance(manifest[key], dict):
-            result = search_manifest_values(manifest[key], value)
+    for key, value in manifest.items():
+        # manifests only contain plain json types, so dispatch on the exact type
+        value_type = type(value)
+        if value_type is dict:
+            result = search_manifest_values(value, value_match)
             if result:  # result is non-empty
                 filtered_manifest[key] = result
-        else:
-            if manifest[key] is None:
-                continue
-
-            if isinstance(manifest[key], (list, tuple)):
-                if fnmatch.filter([str(v) for v in manifest[key]], value):
-                    filtered_manifest[key] = manifest[key]
-            else:
-                if fnmatch.fnmatch(str(manifest[key]), value):
-                    filtered_manifest[key] = manifest[key]
+        elif value is None:
+            continue
+        elif value_type is list or value_type is tuple:
+            if any(value_match(v if type(v) is str else str(v)) for v in value):
+                filtered_manifest[key] = value
+        elif value_type is str:
+            if value_match(value):
+                filtered_manifest[key] = value
+        elif value_match(str(value)):
+            filtered_manifest[key] = value
     return filtered_manifest
 
 
@@ -283,13 +301,14 @@ def search_manifest(manifest, key_search=None, value_search=None):
     '''
     return_manifest = manifest
     if key_search:
-        if '*' not in key_search or '?' not in key_search:
+        if '*' not in key_search and '?' not in key_search:
             key_search = f'*{key_search}*'
-        return_manifest = search_manifest_keys(return_manifest, key_search)
+        return_manifest = search_manifest_keys(return_manifest, _compile_search(key_search))
     if value_search:
-        if '*' not in value_search or '?' not in value_search:
+        if '*' not in value_search and '?' not in value_search:
             value_search = f'*{value_search}*'
-        return_manifest = search_manifest_values(return_manifest, value_search)
+        return_manifest = search_manifest_values(return_manifest,
+                                                 _compile_search(value_search))
     return return_manifest
 
 
@@ -299,12 +318,13 @@ def get_total_manifest_key_count(manifest):
 
     Args:
         manifest (dictionary) : A dictionary representing the manifest.
-        acc (int) : An accumulator of the current number of folders and files.
     '''
-    acc = len(manifest)
-    for key in manifest:
-        if isinstance(manifest[key], dict):
-            acc += get_total_manifest_key_count(manifest[key])
+    acc = 0
+    stack = [manifest]
+    while stack:
+        section = stack.pop()
+        acc += len(section)
+        stack.extend(value for value in section.values() if isinstance(value, dict))
     return acc
 
 
@@ -331,10 +351,10 @@ def get_metrics_source(project, step, index):
     if not project.valid('tool', tool, 'task', task, 'report'):
         return metric_primary_source, file_to_metric
 
-    metrics = project.getkeys('tool', tool, 'task', task, 'report')
+    report_schema = project.get('tool', tool, 'task', task, 'report', field='schema')
 
-    for metric in metrics:
-        sources = project.get('tool', tool, 'task', task, 'report', metric, step=step, index=index)
+    for metric in report_schema.getkeys():
+        sources = report_schema.get(metric, step=step, index=index)
         if sources:
             metric_primary_source.setdefault(sources[0], []).append(metric)
         for source in sources:
@@ -353,29 +373,67 @@ def get_files(project, step, index):
         step (string) : Step of node.
         index (string) : Index of node.
     '''
-    # could combine filters, but slightly more efficient to separate them
-    # Is remaking the list with sets instead of list worth it?
+    # scans directly rather than through os.walk, so the entries are sorted
+    # into sets as they are read, with the same handling of links and errors
     logs_and_reports = []
-    all_paths = os.walk(workdir(project, step=step, index=index))
-    for path_name, folders, files in all_paths:
-        logs_and_reports.append((path_name, set(folders), set(files)))
+    to_search = [workdir(project, step=step, index=index)]
+    while to_search:
+        path_name = to_search.pop()
+        folders = set()
+        files = set()
+        try:
+            with os.scandir(path_name) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        folders.add(entry.name)
+                        if not entry.is_symlink():
+                            to_search.append(entry.path)
+                    else:
+                        files.add(entry.name)
+        except OSError:
+            continue
+        logs_and_reports.append((path_name, folders, files))
     return logs_and_reports
 
 
+def collect_chart_data(project):
+    '''
+    Returns the unformatted report data used to build charts for the project.
+
+    Callers that know the project will not change can collect this once and
+    pass it in as 'chart_data' to avoid reading the schema on every call.
+
+    Args:
+        project (Project) : The project object that contains the schema read from.
+    '''
+    return utils._collect_data(project, format_as_string=False)
+
+
+def _get_chart_data(project_and_project_name):
+    chart_data = project_and_project_name.get('chart_data')
+    if chart_data is None:
+        chart_data = collect_chart_data(project_and_project_name['project_object'])
+    return chart_data
+
+
 def get_chart_selection_options(projects):
     '''
     Returns all the nodes and metrics available in the provided projects
 
     Args:
         projects (list) : A list of dictionaries with the form
-            {'project_object': project, 'project_name': name}.
+            {'project_object': project, 'project_name': name}, optionally
+            with 'chart_data' from :func:`collect_chart_data`.
     '''
     nodes = set()
     metrics = set()
     for project_and_project_name in projects:
-        project = project_and_project_name['project_object']
-        nodes_list, _, _, _, project_metrics, _ = \
-            utils._collect_data(project, format_as_string=False)
+        nodes_list, _, _, _, project_metrics, _ = _get_chart_data(project_and_project_name)
         nodes.update(set([f'{step}/{index}' for step, index in nodes_list]))
         metrics.update(set(project_metrics))
     return nodes, metrics
@@ -389,7 +447,8 @@ def get_chart_data(projects, metric, nodes):
 
     Args:
         projects (list) : A list of dictionaries with the form
-            {'project_object': project, 'project_name': name}.
+            {'project_object': project, 'project_name': name}, optionally
+            with 'chart_data' from :func:`collect_chart_data`.
         metric (string) : The metric that the user is searching.
         nodes (list) : A list of dictionaries with the form (step, index).
     '''
@@ -397,23 +456,15 @@ def get_chart_data(projects, metric, nodes):
     metric_datapoints = {}
     metric_unit = ''
     for project_and_project_name in projects:
-        project = project_and_project_name['project_object']
         project_name = project_and_project_name['project_name']
-        _, _, metrics, metrics_unit, _, _ = \
-            utils._collect_data(project, format_as_string=False)
+        _, _, metrics, metrics_unit, _, _ = _get_chart_data(project_and_project_name)
         if metric in metrics_unit:
             metric_unit = metrics_unit[metric]
             metric_units.add(metric_unit)
         for node in nodes:
-            if node not in metrics:
-                continue
-            value = metrics[node][metric]
-            if value is None:
-                continue
-            if node in metric_datapoints:
-                metric_datapoints[node][project_name] = value
-            else:
-                metric_datapoints[node] = {project_name: value}
+            value = metrics.get(node, {}).get(metric)
+            if value is not None:
+                metric_datapoints.setdefault(node, {})[project_name] = value
     if len(metric_units) > 1:
         raise ValueError('Not all measurements were made with the same units')
     return metric_datapoints, metric_unit
@@ -14,6 +14,23 @@ def _find_summary_image(project, ext='png'):
     return None
 
 
+def _get_node_records(project, step, index):
+    records = {}
+    record_schema = project.get('record', field='schema')
+    for record in record_schema.getkeys():
+        # look up the parameter once, so checking its pernode setting and
+        # reading its value do not each descend through the schema
+        param = record_schema.get(record, field=None)
+        if param.get(field='pernode').is_never():
+            value = param.get()
+        else:
+            value = param.get(step=step, index=index)
+
+        if value is not None:
+            records[record] = value
+    return records
+
+
 def _collect_data(project, flow=None, flowgraph_nodes=None, format_as_string=True):
     if not flow:
         flow = project.get('option', 'flow')
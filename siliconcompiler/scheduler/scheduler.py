@@ -281,7 +281,8 @@ class Scheduler:
             filepath = os.path.join(jobdir(self.__project), f"{self.__name}.pkg.json")
             self.__project.write_manifest(filepath)
 
-            send_messages.send(self.__project, 'summary', None, None)
+            send_messages.send(self.__project, 'summary', None, None,
+                               flowgraph_nodes=self.__flow_runtime.get_nodes())
         finally:
             if self.__joblog_handler is not None:
                 self.__logger.removeHandler(self.__joblog_handler)
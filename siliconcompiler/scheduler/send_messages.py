@@ -7,10 +7,14 @@ It loads SMTP server credentials from a configuration file, constructs
 HTML-formatted emails with relevant job data and attachments (logs, images),
 and sends them to specified recipients.
 """
+import atexit
 import fastjsonschema
+import functools
 import json
 import os
 import smtplib
+import threading
+import time
 import uuid
 
 import os.path
@@ -20,7 +24,6 @@ from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from pathlib import Path
 
-from siliconcompiler import sc_open
 from siliconcompiler.utils import default_email_credentials_file, get_file_template
 from siliconcompiler.report import utils as report_utils
 from siliconcompiler.schema import Parameter
@@ -28,12 +31,31 @@ from siliconcompiler.flowgraph import RuntimeFlowgraph
 from siliconcompiler.utils.paths import workdir
 
 
-# Compile validation code for API request bodies.
+# Validation schemas for the email configuration.
 api_dir = Path(__file__).parent / 'validation'
 
-# 'remote_run': Run a stage of a job using the server's cluster settings.
-with open(api_dir / 'email_credentials.json') as schema:
-    validate_creds = fastjsonschema.compile(json.loads(schema.read()))
+# Logged in SMTP connection kept between messages, along with the server it
+# is connected to, the process that owns it, and when it was last used.
+# Only the process that registered the atexit hook keeps its connection open,
+# forked children exit without running atexit handlers.
+__SMTP_IDLE_TIMEOUT = 30
+# Longest line allowed in a message body by SMTP (RFC 5321), excluding CRLF
+__SMTP_MAX_LINE_LENGTH = 998
+__smtp_lock = threading.Lock()
+__smtp_pool = {}
+
+
+@functools.lru_cache(maxsize=1)
+def __get_credentials_validator():
+    """
+    Compiles the email credentials validator on first use, so the schema is
+    only loaded when an email is sent.
+
+    Returns:
+        function: The validation function for the email credentials.
+    """
+    with open(api_dir / 'email_credentials.json') as schema:
+        return fastjsonschema.compile(json.loads(schema.read()))
 
 
 def __load_config(project):
@@ -59,13 +81,147 @@ def __load_config(project):
         creds = json.load(f)
 
     try:
-        return validate_creds(creds)
+        return __get_credentials_validator()(creds)
     except fastjsonschema.JsonSchemaException as e:
         project.logger.error(f'Email credentials failed to validate: {e}')
         return {}
 
 
-def send(project, msg_type, step, index):
+@functools.lru_cache(maxsize=None)
+def __get_template(path):
+    """
+    Loads an email template, only parsing each template once.
+
+    Args:
+        path (str): Path to the template, relative to the templates directory.
+
+    Returns:
+        Template: The compiled template.
+    """
+    return get_file_template(path)
+
+
+def __read_log_tail(path, lines, block_size=65536):
+    """
+    Reads the last lines of a log file without loading the entire file.
+
+    Blocks are read backwards from the end of the file until enough lines
+    have been found.
+
+    Args:
+        path (str): Path to the log file.
+        lines (int): Maximum number of lines to return.
+        block_size (int): Number of bytes to read at a time.
+
+    Returns:
+        list: The last lines of the file.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        content = b''
+        while position > 0 and content.count(b'\n') <= lines:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            content = f.read(read_size) + content
+
+    return content.decode(errors='ignore').splitlines()[-lines:]
+
+
+def __quit_smtp(smtp_server):
+    """
+    Closes an SMTP connection, ignoring errors from servers that already
+    dropped it.
+
+    Args:
+        smtp_server (SMTP): The connection to close.
+    """
+    try:
+        smtp_server.quit()
+    except (smtplib.SMTPException, OSError):
+        smtp_server.close()
+
+
+def __release_smtp_connection():
+    """
+    Closes and forgets the cached SMTP connection. The caller must hold the
+    connection lock.
+
+    A connection inherited from a parent process is only forgotten, since
+    closing it would also end the parent's session.
+    """
+    smtp_server = __smtp_pool.get("connection")
+    owner = __smtp_pool.get("pid")
+    __smtp_pool.clear()
+
+    if smtp_server is not None and owner == os.getpid():
+        __quit_smtp(smtp_server)
+
+
+def __close_smtp_connection():
+    """
+    Closes the cached SMTP connection, if there is one.
+    """
+    with __smtp_lock:
+        __release_smtp_connection()
+
+
+atexit.register(__close_smtp_connection)
+__SMTP_POOL_PID = os.getpid()
+
+
+def __get_smtp_connection(project, cred):
+    """
+    Returns a logged in SMTP connection for the credentials.
+
+    The previous connection is reused if it belongs to this process, is for
+    the same server and account, has been idle for less than
+    ``__SMTP_IDLE_TIMEOUT`` seconds, and still responds to a NOOP. Otherwise
+    a new connection is opened. The caller must hold the connection lock.
+
+    Args:
+        project (Project): The project object, used for logging.
+        cred (dict): The validated email credentials.
+
+    Returns:
+        SMTP: The connection, or None if logging in failed.
+    """
+    key = (cred["server"], cred["port"], cred["ssl"], cred["username"])
+
+    if __smtp_pool.get("pid") == os.getpid() and __smtp_pool.get("key") == key and \
+            time.time() - __smtp_pool["last_used"] < __SMTP_IDLE_TIMEOUT:
+        try:
+            if __smtp_pool["connection"].noop()[0] == 250:
+                return __smtp_pool["connection"]
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    __release_smtp_connection()
+
+    # Determine whether to use SSL for the SMTP connection
+    if cred['ssl']:
+        smtp_use = smtplib.SMTP_SSL
+    else:
+        smtp_use = smtplib.SMTP
+
+    smtp_server = smtp_use(cred["server"], cred["port"])
+    try:
+        smtp_server.login(cred["username"], cred["password"])
+    except smtplib.SMTPAuthenticationError as e:
+        project.logger.error(f'Unable to authenticate to email server: {e}')
+        __quit_smtp(smtp_server)
+        return None
+    except Exception as e:
+        project.logger.error(f'An error occurred during login to email server: {e}')
+        __quit_smtp(smtp_server)
+        return None
+
+    __smtp_pool.update(connection=smtp_server, key=key, pid=os.getpid(), last_used=time.time())
+    return smtp_server
+
+
+def send(project, msg_type, step, index, flowgraph_nodes=None):
     """
     Constructs and sends an email notification for a specific job event.
 
@@ -74,6 +230,10 @@ def send(project, msg_type, step, index):
     subject, HTML body, and relevant attachments (logs or images) and sends
     it via the configured SMTP server.
 
+    The SMTP connection is kept open for later messages only in the process
+    that loaded this module. Other processes, such as forked nodes, close it
+    once the message is sent.
+
     Args:
         project (Project): The project object containing all run data and configuration.
         msg_type (str): The type of event triggering the message (e.g., 'begin',
@@ -82,6 +242,8 @@ def send(project, msg_type, step, index):
             global events.
         index (str): The index associated with the event. Can be None for
             global events.
+        flowgraph_nodes (list): Nodes to include in a summary message. If not
+            provided, the nodes are computed from the project's runtime flowgraph.
     """
     project_step, project_index = step, index
     if step is None:
@@ -136,17 +298,18 @@ def send(project, msg_type, step, index):
                                           filename=os.path.basename(layout_img))
                     msg.attach(img_attach)
 
-            runtime = RuntimeFlowgraph(
-                project.get("flowgraph", flow, field='schema'),
-                from_steps=project.get('option', 'from'),
-                to_steps=project.get('option', 'to'),
-                prune_nodes=project.get('option', 'prune'))
+            if flowgraph_nodes is None:
+                flowgraph_nodes = RuntimeFlowgraph(
+                    project.get("flowgraph", flow, field='schema'),
+                    from_steps=project.get('option', 'from'),
+                    to_steps=project.get('option', 'to'),
+                    prune_nodes=project.get('option', 'prune')).get_nodes()
 
             nodes, errors, metrics, metrics_unit, metrics_to_show, _ = \
                 report_utils._collect_data(project, flow=flow,
-                                           flowgraph_nodes=runtime.get_nodes())
+                                           flowgraph_nodes=flowgraph_nodes)
 
-            text_msg = get_file_template('email/summary.j2').render(
+            text_msg = __get_template('email/summary.j2').render(
                 design=project.name,
                 nodes=nodes,
                 errors=errors,
@@ -159,29 +322,24 @@ def send(project, msg_type, step, index):
             for log in (f'sc_{step}_{index}.log', f'{step}.log'):
                 log_file = f'{workdir(project, step=step, index=index)}/{log}'
                 if os.path.exists(log_file):
-                    with sc_open(log_file) as f:
-                        file_content = f.read().splitlines()
-                        # Limit to max_file_size
-                        file_content = file_content[-cred["max_file_size"]:]
-                        log_attach = MIMEApplication("\n".join(file_content))
-                        log_name, _ = os.path.splitext(log)
-                        # Make attachment a txt file to avoid issues with tools not loading .log
-                        log_attach.add_header('Content-Disposition',
-                                              'attachment',
-                                              filename=f'{log_name}.txt')
-                        msg.attach(log_attach)
+                    # Limit to max_file_size
+                    file_content = __read_log_tail(log_file, cred["max_file_size"])
+                    # Plain ascii logs can be sent as is, others need to be encoded
+                    if all(line.isascii() and len(line) <= __SMTP_MAX_LINE_LENGTH
+                           for line in file_content):
+                        charset = 'us-ascii'
+                    else:
+                        charset = 'utf-8'
+                    log_attach = MIMEText("\n".join(file_content), 'plain', charset)
+                    log_name, _ = os.path.splitext(log)
+                    # Make attachment a txt file to avoid issues with tools not loading .log
+                    log_attach.add_header('Content-Disposition',
+                                          'attachment',
+                                          filename=f'{log_name}.txt')
+                    msg.attach(log_attach)
 
             # Collect records for the specific node
-            records = {}
-            for record in project.getkeys('record'):
-                value = None
-                if project.get('record', record, field='pernode').is_never():
-                    value = project.get('record', record)
-                else:
-                    value = project.get('record', record, step=step, index=index)
-
-                if value is not None:
-                    records[record] = value
+            records = report_utils._get_node_records(project, step, index)
 
             # Collect metrics for the specific node
             nodes, errors, metrics, metrics_unit, metrics_to_show, _ = \
@@ -190,7 +348,7 @@ def send(project, msg_type, step, index):
             status = project.get('record', 'status', step=step, index=index)
 
             # Render the general email template
-            text_msg = get_file_template('email/general.j2').render(
+            text_msg = __get_template('email/general.j2').render(
                 design=project.name,
                 job=jobname,
                 step=step,
@@ -206,28 +364,22 @@ def send(project, msg_type, step, index):
     body = MIMEText(text_msg, 'html')
     msg.attach(body)
 
-    # Determine whether to use SSL for the SMTP connection
-    if cred['ssl']:
-        smtp_use = smtplib.SMTP_SSL
-    else:
-        smtp_use = smtplib.SMTP
+    # Connect to the SMTP server, or reuse the open connection, and send the email
+    with __smtp_lock:
+        smtp_server = __get_smtp_connection(project, cred)
+        if smtp_server is None:
+            return
 
-    # Connect to the SMTP server and send the email
-    with smtp_use(cred["server"], cred["port"]) as smtp_server:
-        do_send = False
         try:
-            smtp_server.login(cred["username"], cred["password"])
-            do_send = True
-        except smtplib.SMTPAuthenticationError as e:
-            project.logger.error(f'Unable to authenticate to email server: {e}')
+            smtp_server.sendmail(msg['From'], to, msg.as_string())
+            __smtp_pool["last_used"] = time.time()
         except Exception as e:
-            project.logger.error(f'An error occurred during login to email server: {e}')
-
-        if do_send:
-            try:
-                smtp_server.sendmail(msg['From'], to, msg.as_string())
-            except Exception as e:
-                project.logger.error(f'An error occurred while sending email: {e}')
+            project.logger.error(f'An error occurred while sending email: {e}')
+            __release_smtp_connection()
+        else:
+            if os.getpid() != __SMTP_POOL_PID:
+                # The atexit hook will not run here, so close the connection now
+                __release_smtp_connection()
 
 
 if __name__ == "__main__":
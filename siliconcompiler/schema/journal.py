@@ -1,5 +1,4 @@
-import copy
-import json
+import sys
 
 from typing import Tuple, Set, Dict, List, Optional, Union, TYPE_CHECKING
 
@@ -25,8 +24,9 @@ class Journal:
 
         self.__parent = self
 
+        self.__journal = None
         self.__record_types = set()
-        self.stop()
+        self.__recording = frozenset()
 
     @property
     def keypath(self) -> Tuple[str, ...]:
@@ -44,7 +44,7 @@ class Journal:
             keypath (list of str): keypath to prefix on to recorded path
         '''
 
-        child = Journal(keyprefix=[*self.__keyprefix, *keypath])
+        child = Journal(keyprefix=self.__keyprefix + keypath)
         child.__parent = self.__parent
         return child
 
@@ -56,14 +56,55 @@ class Journal:
             manifest (dict): Manifest to decode.
         '''
 
-        self.__journal = manifest
+        if manifest is None:
+            self.__journal = None
+            self.__update_recording()
+            return
+
+        # Records are stored as (type, key, value, field, step, index) tuples
+        self.__journal = [(sys.intern(record["type"]), tuple(record["key"]), record["value"],
+                           record["field"], record["step"], record["index"])
+                          for record in manifest]
+        self.__update_recording()
 
     def get(self) -> Optional[List[Dict]]:
         """
         Returns a copy of the current journal
         """
 
-        return copy.deepcopy(self.__parent.__journal)
+        journal = self.__parent.__journal
+        if journal is None:
+            return None
+
+        return [{
+            "type": record_type,
+            "key": key,
+            "value": Journal.__copy_value(value),
+            "field": field,
+            "step": step,
+            "index": index
+        } for record_type, key, value, field, step, index in journal]
+
+    @staticmethod
+    def __copy_value(value):
+        if isinstance(value, list):
+            return [Journal.__copy_value(v) for v in value]
+        return value
+
+    def __len__(self) -> int:
+        """
+        Returns the number of records in the current journal
+        """
+        journal = self.__parent.__journal
+        if journal is None:
+            return 0
+        return len(journal)
+
+    def is_empty(self) -> bool:
+        """
+        Returns true if the current journal has no records
+        """
+        return not self.__parent.__journal
 
     def has_journaling(self) -> bool:
         """
@@ -96,6 +137,7 @@ class Journal:
             raise ValueError(f"{value} is not a valid type")
 
         self.__parent.__record_types.add(value)
+        self.__parent.__update_recording()
 
     def remove_type(self, value: str) -> None:
         """
@@ -109,6 +151,18 @@ class Journal:
             self.__parent.__record_types.remove(value)
         except KeyError:
             pass
+        self.__parent.__update_recording()
+
+    def __update_recording(self) -> None:
+        """
+        Updates the set of access types that will be recorded, this is empty
+        when journaling is not active.
+        """
+
+        if self.__journal is None:
+            self.__recording = frozenset()
+        else:
+            self.__recording = frozenset(self.__record_types)
 
     def record(self,
                record_type: str,
@@ -121,10 +175,8 @@ class Journal:
         Record the schema transaction
         '''
 
-        if self.__parent.__journal is None:
-            return
-
-        if record_type not in self.__parent.__record_types:
+        root = self.__parent
+        if record_type not in root.__recording:
             return
 
         if isinstance(value, set):
@@ -133,31 +185,29 @@ class Journal:
         if index is not None and isinstance(index, int):
             index = str(index)
 
-        self.__parent.__journal.append({
-            "type": record_type,
-            "key": tuple([*self.__keyprefix, *key]),
-            "value": value,
-            "field": field,
-            "step": step,
-            "index": index
-        })
+        root.__journal.append(
+            (record_type, self.__keyprefix + tuple(key), value, field, step, index))
 
     def start(self) -> None:
         '''
         Start journaling the schema transactions
         '''
-        self.__parent.__journal = []
-        self.add_type("set")
-        self.add_type("add")
-        self.add_type("remove")
-        self.add_type("unset")
+        root = self.__parent
+        root.__journal = []
+        root.__record_types.update(("set", "add", "remove", "unset"))
+        root.__update_recording()
 
     def stop(self) -> None:
         '''
         Stop journaling the schema transactions
         '''
-        self.__parent.__journal = None
-        self.__parent.__record_types.clear()
+        root = self.__parent
+        if root.__journal is None and not root.__record_types:
+            return
+
+        root.__journal = None
+        root.__record_types.clear()
+        root.__update_recording()
 
     @staticmethod
     def replay_file(schema: "BaseSchema", filepath: str) -> None:
@@ -168,8 +218,8 @@ class Journal:
             schema (:class:`BaseSchema`): schema to replay transactions to
             filepath (path): path to manifest
         '''
-        with open(filepath, "r") as fid:
-            data = json.load(fid)
+        from .baseschema import BaseSchema
+        data = BaseSchema._read_manifest(filepath)
         if "__journal__" not in data:
             return
 
@@ -189,16 +239,15 @@ class Journal:
         if not isinstance(schema, BaseSchema):
             raise TypeError(f"schema must be a BaseSchema, not {type(schema)}")
 
-        if not self.__parent.__journal:
+        journal = self.__parent.__journal
+        if not journal:
             return
 
-        for action in self.__parent.__journal:
-            record_type = action['type']
-            keypath = action['key']
-            value = action['value']
-            field = action['field']
-            step = action['step']
-            index = action['index']
+        superseded = Journal.__superseded_sets(journal)
+
+        for n, (record_type, keypath, value, field, step, index) in enumerate(journal):
+            if n in superseded:
+                continue
             if record_type == 'set':
                 schema.set(*keypath, value, field=field, step=step, index=index)
             elif record_type == 'add':
@@ -207,11 +256,40 @@ class Journal:
                 schema.unset(*keypath, step=step, index=index)
             elif record_type == 'remove':
                 schema.remove(*keypath)
-            elif record_type == 'get':
-                continue
-            else:
+            elif record_type != 'get':
                 raise ValueError(f'Unknown record type {record_type}')
 
+    @staticmethod
+    def __superseded_sets(journal: List[Tuple]) -> Set[int]:
+        '''
+        Returns the positions of the set records which are replaced by a later set
+        to the same keypath, field, step and index before anything else touches
+        that keypath.
+
+        Args:
+            journal (list): journal records
+        '''
+
+        superseded = set()
+        last_set = {}
+        for n, (record_type, keypath, _, field, step, index) in enumerate(journal):
+            if record_type == 'get':
+                continue
+            if record_type == 'remove':
+                last_set.clear()
+                continue
+            if record_type != 'set':
+                last_set.pop(keypath, None)
+                continue
+
+            target = (field, step, index)
+            prev = last_set.get(keypath)
+            if prev is not None and prev[0] == target:
+                superseded.add(prev[1])
+            last_set[keypath] = (target, n)
+
+        return superseded
+
     @staticmethod
     def access(schema: "BaseSchema") -> "Journal":
         '''
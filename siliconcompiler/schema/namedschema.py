@@ -17,6 +17,9 @@ class NamedSchema(BaseSchema):
         name (str): name of the schema
     '''
 
+    # Class level default so name is available even if __init__ was not called
+    __name: Optional[str] = None
+
     def __init__(self, name: Optional[str] = None):
         super().__init__()
 
@@ -27,10 +30,7 @@ class NamedSchema(BaseSchema):
         '''
         Returns the name of the schema
         '''
-        try:
-            return self.__name
-        except AttributeError:
-            return None
+        return self.__name
 
     def set_name(self, name: Optional[str]) -> None:
         """
@@ -43,11 +43,8 @@ class NamedSchema(BaseSchema):
             name (str): name for object
         """
 
-        try:
-            if self.__name is not None:
-                raise RuntimeError("Cannot call set_name more than once.")
-        except AttributeError:
-            pass
+        if self.__name is not None:
+            raise RuntimeError("Cannot call set_name more than once.")
         if name is not None and "." in name:
             raise ValueError("Named schema object cannot contains: .")
         self.__name = name
@@ -225,6 +225,7 @@ class Task(NamedSchema, PathSchema, DocsSchema):
         self.__schema_metric: Optional[MetricSchema] = None
         self.__schema_flow: Optional[Flowgraph] = None
         self.__schema_flow_runtime: Optional[RuntimeFlowgraph] = None
+        self.__input_node_files: Optional[Dict[str, List[Tuple[str, str]]]] = None
         if self.__schema_full:
             self.__schema_record = self.__schema_full.get("record", field="schema")
             self.__schema_metric = self.__schema_full.get("metric", field="schema")
@@ -1101,6 +1102,15 @@ class Task(NamedSchema, PathSchema, DocsSchema):
         Returns a dictionary of files from input nodes, mapped to the node
         they originated from.
         """
+        if self.__input_node_files is None:
+            self.__input_node_files = self.__collect_files_from_input_nodes()
+
+        return {file: list(nodes) for file, nodes in self.__input_node_files.items()}
+
+    def __collect_files_from_input_nodes(self) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Collects the files from the input nodes for the current runtime.
+        """
         nodes = self.schema_flowruntime.get_nodes()
         inputs = {}
         for in_step, in_index in self.schema_flow.get(self.step, self.index, 'input'):
@@ -35,6 +35,7 @@
 
 import pya
 import os
+import re
 import sys
 import fnmatch
 
@@ -61,60 +62,83 @@ def gds_export(design_name, in_def, in_files, out_file, tech, allow_missing, con
     for cell in def_cells:
         print(f"  [INFO] DEF cell: {cell}")
 
-    if f"{design_name}_DEF_FILL" in def_cells:
-        def_cells.remove(f"{design_name}_DEF_FILL")
+    def_cells = set(def_cells)
+    def_cells.discard(f"{design_name}_DEF_FILL")
 
     # Load in the gds to merge
     print("[INFO] Merging GDS/OAS files...")
+    merged_cells = {}
     for fil in in_files:
+        # Each file gets its own layout, copy_tree() scales the cells to the DEF database unit
         macro_layout = pya.Layout()
         macro_layout.read(fil)
         print(f"[INFO] Read in {fil}")
-        for cell in list(def_cells):
-            if macro_layout.has_cell(cell):
-                subcell = main_layout.cell(cell)
-                print(f"  [INFO] Merging in {cell}")
-                subcell.copy_tree(macro_layout.cell(cell))
-                def_cells.remove(cell)
-
-    # Copy the top level only to a new layout
-    print("[INFO] Copying toplevel cell '{0}'".format(design_name))
-    top_only_layout = pya.Layout()
-    top_only_layout.dbu = main_layout.dbu
-    top = top_only_layout.create_cell(design_name)
-    top.copy_tree(main_layout.cell(design_name))
+        macro_cells = sorted(macro_cell.name for macro_cell in macro_layout.each_cell()
+                             if macro_cell.name in def_cells or macro_cell.name in merged_cells)
+        for cell in macro_cells:
+            if cell in merged_cells:
+                print(f"  [WARNING] Duplicate cell '{cell}' in {fil}, keeping the one from "
+                      f"{merged_cells[cell]}")
+                continue
+            subcell = main_layout.cell(cell)
+            print(f"  [INFO] Merging in {cell}")
+            subcell.copy_tree(macro_layout.cell(cell))
+            def_cells.remove(cell)
+            merged_cells[cell] = fil
+
+    # Keep only the top level hierarchy in the layout, when the design is the
+    # only top cell every other cell is already part of its hierarchy.
+    top = main_layout.cell(design_name)
+    if [cell.cell_index() for cell in main_layout.top_cells()] != [top.cell_index()]:
+        print("[INFO] Removing cells outside of toplevel cell '{0}'".format(design_name))
+        top_hierarchy = set(top.called_cells())
+        top_hierarchy.add(top.cell_index())
+        main_layout.delete_cells([cell.cell_index() for cell in main_layout.each_cell()
+                                  if cell.cell_index() not in top_hierarchy])
 
     print("[INFO] Checking for missing GDS/OAS...")
-    missing_cell = False
-    for check_cell in def_cells:
-        missing_cell = True
-        allowed_missing = any([fnmatch.fnmatch(check_cell, pattern) for pattern in allow_missing])
-        print(f"[{'WARNING' if allowed_missing else 'ERROR'}] LEF Cell '{check_cell}' has no "
-              "matching GDS/OAS cell. Cell will be empty")
-
-    if not missing_cell:
+    allow_missing_match = None
+    if allow_missing:
+        allow_missing_match = re.compile(
+            "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in allow_missing)).match
+    if def_cells:
+        missing_messages = []
+        for check_cell in sorted(def_cells):
+            allowed_missing = bool(allow_missing_match and allow_missing_match(check_cell))
+            missing_messages.append(f"[{'WARNING' if allowed_missing else 'ERROR'}] LEF Cell "
+                                    f"'{check_cell}' has no matching GDS/OAS cell. "
+                                    "Cell will be empty")
+        print("\n".join(missing_messages))
+    else:
         print("[INFO] All LEF cells have matching GDS/OAS cells")
 
     print("[INFO] Checking for orphan cell in the final layout...")
-    for i in top_only_layout.each_cell():
+    for i in main_layout.each_cell():
         if i.name != design_name and i.parent_cells() == 0:
             print("[ERROR] Found orphan cell '{0}'".format(i.name))
 
     if seal_file:
-        top_cell = top_only_layout.top_cell()
+        top_cell = main_layout.top_cell()
 
         print("[INFO] Reading seal GDS/OAS file...")
         print("\t{0}".format(seal_file))
-        top_only_layout.read(seal_file)
+        main_layout.read(seal_file)
 
-        for cell in top_only_layout.top_cells():
+        for cell in main_layout.top_cells():
             if cell != top_cell:
                 print("[INFO] Merging '{0}' as child of '{1}'".format(cell.name, top_cell.name))
                 top.insert(pya.CellInstArray(cell.cell_index(), pya.Trans()))
 
-    # Write out the GDS
+    # Write out the GDS as plain cells without library context information, leaving
+    # out the empty layers created from the DEF layer map
     print("[INFO] Writing out GDS/OAS '{0}'".format(out_file))
-    top_only_layout.write(out_file, get_write_options(out_file, timestamps))
+    write_options = get_write_options(out_file, timestamps)
+    write_options.write_context_info = False
+    write_options.deselect_all_layers()
+    for layer in main_layout.layer_indexes():
+        if not top.begin_shapes_rec(layer).at_end():
+            write_options.add_layer(layer, main_layout.get_info(layer))
+    main_layout.write(out_file, write_options)
 
 
 def main():
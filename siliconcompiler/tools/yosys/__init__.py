@@ -12,11 +12,11 @@ Sources: https://github.com/YosysHQ/yosys
 
 Installation: https://github.com/YosysHQ/yosys
 '''
-import json
+import orjson
 import os
 import re
 
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 
 from siliconcompiler import sc_open
 
@@ -381,11 +381,19 @@ class YosysTask(Task):
         # an "implicit post release number".
         return version.replace('+', '-')
 
-    def _synthesis_post_process(self):
+    def _synthesis_post_process(self) -> Optional[Dict]:
+        """
+        Records the common synthesis metrics.
+
+        Returns:
+            The parsed cell statistics report, or None if it is missing.
+        """
+        stat = None
         stat_json = "reports/stat.json"
         if os.path.exists(stat_json):
             with sc_open(stat_json) as f:
-                metrics = json.load(f)
+                stat = orjson.loads(f.read())
+                metrics = stat
                 if "design" in metrics:
                     metrics = metrics["design"]
 
@@ -414,3 +422,5 @@ class YosysTask(Task):
                     registers += int(line_registers[0])
         if registers is not None:
             self.record_metric("registers", registers, source_file=self.get_logpath("exe"))
+
+        return stat
@@ -1,4 +1,4 @@
-import json
+import orjson
 
 import os.path
 
@@ -435,22 +435,19 @@ class ASICSynthesis(_ASICTask, YosysTask):
 
     def post_process(self):
         super().post_process()
-        self._synthesis_post_process()
-        self._generate_cell_area_report()
+        stat = self._synthesis_post_process()
+        self._generate_cell_area_report(stat)
 
-    def _generate_cell_area_report(self):
-        stat_json = "reports/stat.json"
+    def _generate_cell_area_report(self, stat):
         netlist = f"outputs/{self.design_topmodule}.netlist.json"
-        if not os.path.exists(stat_json):
+        if not stat:
             return
         if not os.path.exists(netlist):
             return
 
         # Load data
-        with sc_open(stat_json) as fd:
-            stat = json.load(fd)
         with sc_open(netlist) as fd:
-            netlist = json.load(fd)
+            netlist = orjson.loads(fd.read())
 
         modules = []
         for module in stat["modules"].keys():
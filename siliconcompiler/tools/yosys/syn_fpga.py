@@ -1,7 +1,3 @@
-import json
-
-from siliconcompiler import sc_open
-
 from siliconcompiler.tools.yosys import YosysTask
 
 
@@ -56,47 +52,43 @@ class FPGASynthesis(YosysTask):
     def post_process(self):
         super().post_process()
 
-        self._synthesis_post_process()
+        metrics = self._synthesis_post_process()
+        if metrics is None:
+            raise FileNotFoundError("reports/stat.json")
 
         fpga = self.project.get("fpga", "device")
 
-        with sc_open("reports/stat.json") as f:
-            metrics = json.load(f)
-            if "design" in metrics:
-                metrics = metrics["design"]
-            else:
-                return
+        if "design" in metrics:
+            metrics = metrics["design"]
+        else:
+            return
 
-            if "num_cells_by_type" in metrics:
-                metrics = metrics["num_cells_by_type"]
-            else:
-                return
-
-            dff_cells = []
-            if self.project.valid("library", fpga, "tool", "yosys", "registers"):
-                dff_cells = self.project.get("library", fpga, "tool", "yosys", "registers")
-            brams_cells = []
-            if self.project.valid("library", fpga, "tool", "yosys", "brams"):
-                brams_cells = self.project.get("library", fpga, "tool", "yosys", "brams")
-            dsps_cells = []
-            if self.project.valid("library", fpga, "tool", "yosys", "dsps"):
-                dsps_cells = self.project.get("library", fpga, "tool", "yosys", "dsps")
-
-            data = {
-                "registers": 0,
-                "luts": 0,
-                "dsps": 0,
-                "brams": 0
-            }
-            for cell, count in metrics.items():
-                if cell == "$lut":
-                    data["luts"] += count
-                elif cell in dff_cells:
-                    data["registers"] += count
-                elif cell in dsps_cells:
-                    data["dsps"] += count
-                elif cell in brams_cells:
-                    data["brams"] += count
-
-            for metric, value in data.items():
-                self.record_metric(metric, value, source_file="reports/stat.json")
+        if "num_cells_by_type" in metrics:
+            metrics = metrics["num_cells_by_type"]
+        else:
+            return
+
+        # Map each cell type to its metric, later entries take precedence
+        cell_metric = {}
+        if fpga:
+            for metric in ("brams", "dsps", "registers"):
+                try:
+                    cells = self.project.get("library", fpga, "tool", "yosys", metric)
+                except KeyError:
+                    continue
+                cell_metric.update((cell, metric) for cell in cells)
+        cell_metric["$lut"] = "luts"
+
+        data = {
+            "registers": 0,
+            "luts": 0,
+            "dsps": 0,
+            "brams": 0
+        }
+        for cell, count in metrics.items():
+            metric = cell_metric.get(cell)
+            if metric:
+                data[metric] += count
+
+        for metric, value in data.items():
+            self.record_metric(metric, value, source_file="reports/stat.json")
@@ -1,5 +1,7 @@
-import contextlib
+import errno
+import functools
 import logging
+import operator
 import re
 import pathlib
 import psutil
@@ -13,7 +15,8 @@ from io import StringIO
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, Template
 
-from typing import Dict, Optional, Union, Callable, List, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Collection, Mapping, Optional, Union, Callable, List, Tuple, TYPE_CHECKING
 
 import sys
 if sys.version_info < (3, 10):
@@ -27,10 +30,33 @@ if TYPE_CHECKING:
     from siliconcompiler.project import Project
 
 
-def link_symlink_copy(srcfile, dstfile):
-    # first try hard linking, then symbolic linking,
-    # and finally just copy the file
-    for method in [os.link, os.symlink, shutil.copy2]:
+# (source directory, destination directory) pairs that cannot be hard linked
+__CROSS_DEVICE_DIRS = set()
+
+
+def __link_or_copy(srcfile, dstfile, methods):
+    if os.path.lexists(dstfile):
+        try:
+            if os.path.samefile(srcfile, dstfile):
+                # already linked, nothing to do
+                return None
+        except OSError:
+            pass
+        # linking onto an existing file always fails, so only the copy can succeed
+        methods = methods[-1:]
+    else:
+        # Absolute so the same relative names after a chdir are treated as new directories
+        dirs = (os.path.dirname(os.path.abspath(srcfile)),
+                os.path.dirname(os.path.abspath(dstfile)))
+        if dirs not in __CROSS_DEVICE_DIRS:
+            try:
+                return os.link(srcfile, dstfile)
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    # linking between these directories will keep failing, so skip it from now on
+                    __CROSS_DEVICE_DIRS.add(dirs)
+
+    for method in methods:
         try:
             # create link
             return method(srcfile, dstfile)
@@ -39,29 +65,35 @@ def link_symlink_copy(srcfile, dstfile):
             pass
 
 
-def link_copy(srcfile, dstfile):
+def link_symlink_copy(srcfile, dstfile):
     # first try hard linking, then symbolic linking,
     # and finally just copy the file
-    for method in [os.link, shutil.copy2]:
-        try:
-            # create link
-            return method(srcfile, dstfile)
-            # success, no need to continue trying
-        except OSError:
-            pass
+    return __link_or_copy(srcfile, dstfile, (os.symlink, shutil.copy2))
 
 
-def get_file_ext(filename: str) -> str:
-    '''Get base file extension for a given path, disregarding .gz.'''
-    if filename.lower().endswith('.gz'):
-        filename = os.path.splitext(filename)[0]
-    filetype = os.path.splitext(filename)[1].lower().lstrip('.')
-    return filetype
+def link_copy(srcfile, dstfile):
+    # first try hard linking, and then just copy the file
+    return __link_or_copy(srcfile, dstfile, (shutil.copy2,))
 
 
-def get_default_iomap() -> Dict[str, str]:
+def get_file_ext(filename: str) -> str:
+    '''Get base file extension for a given path, disregarding .gz.'''
+    filename = os.path.basename(filename)
+    if filename[-3:].lower() == '.gz':
+        filename = filename[:-3]
+    # Leading dots do not start an extension, same as os.path.splitext
+    _, dot, filetype = filename.lstrip('.').rpartition('.')
+    if not dot:
+        return ''
+    return filetype.lower()
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_iomap() -> Mapping[str, str]:
     """
     Default input file map for SC with filesets and extensions
+
+    The map is built once and returned as a read-only mapping.
     """
 
     # Record extensions:
@@ -173,7 +205,7 @@ def get_default_iomap() -> Dict[str, str]:
 
     default_iomap.update({ext: "verilatorctrlfile" for ext in verilator})
 
-    return default_iomap
+    return MappingProxyType(default_iomap)
 
 
 def default_credentials_file() -> str:
@@ -194,25 +226,21 @@ def default_email_credentials_file() -> str:
     return cfg_file
 
 
-@contextlib.contextmanager
 def sc_open(path: str, *args, **kwargs):
     if 'errors' not in kwargs:
         kwargs['errors'] = 'ignore'
     kwargs["newline"] = "\n"
-    fobj = open(path, *args, **kwargs)
-    try:
-        with contextlib.closing(fobj):
-            yield fobj
-    finally:
-        pass
+    return open(path, *args, **kwargs)
+
+
+__TEMPLATE_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data',
+    'templates')
 
 
 def get_file_template(path: str,
-                      root: str = os.path.join(
-                          os.path.dirname(
-                              os.path.dirname(os.path.abspath(__file__))),
-                          'data',
-                          'templates')) -> Template:
+                      root: str = __TEMPLATE_ROOT) -> Template:
     if os.path.isabs(path):
         root = os.path.dirname(path)
         path = os.path.basename(path)
@@ -220,28 +248,41 @@ def get_file_template(path: str,
     import siliconcompiler
     scroot = os.path.dirname(siliconcompiler.__file__)
 
-    env = Environment(loader=FileSystemLoader([root, scroot]))
-    return env.get_template(path)
+    # Templates shipped with siliconcompiler do not change, so skip checking
+    # them for updates on every access
+    auto_reload = root != __TEMPLATE_ROOT
+
+    # Key the environment on the absolute root so the same directory always
+    # maps to one loader, regardless of how it was spelled or the current directory
+    return __get_template_environment(os.path.abspath(root), scroot, auto_reload) \
+        .get_template(path)
+
+
+@functools.lru_cache(maxsize=64)
+def __get_template_environment(root: str, scroot: str, auto_reload: bool) -> Environment:
+    # Reuse the environment so jinja can keep its compiled templates
+    return Environment(loader=FileSystemLoader([root, scroot]), auto_reload=auto_reload,
+                       autoescape=False)
 
 
 #######################################
+# supported relational operations
+__COMPARE_OPERATORS = MappingProxyType({
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne
+})
+
+
 def safecompare(value: Union[int, float], op: str, goal: Union[int, float]) -> bool:
-    # supported relational operations
-    # >, >=, <=, <. ==, !=
-    if op == ">":
-        return bool(value > goal)
-    elif op == ">=":
-        return bool(value >= goal)
-    elif op == "<":
-        return bool(value < goal)
-    elif op == "<=":
-        return bool(value <= goal)
-    elif op == "==":
-        return bool(value == goal)
-    elif op == "!=":
-        return bool(value != goal)
-    else:
-        raise ValueError(f"Illegal comparison operation {op}")
+    try:
+        compare = __COMPARE_OPERATORS[op]
+    except KeyError:
+        raise ValueError(f"Illegal comparison operation {op}") from None
+    return bool(compare(value, goal))
 
 
 ###########################################################################
@@ -266,18 +307,53 @@ def grep(project: "Project", args: str, line: str) -> Union[None, str]:
     if line is None:
         return None
 
-    # Partial list of supported grep options
-    options = {
-        '-v': False,  # Invert the sense of matching
-        '-i': False,  # Ignore case distinctions in patterns and data
-        '-E': False,  # Interpret PATTERNS as extended regular expressions.
-        '-e': False,  # Safe interpretation of pattern starting with "-"
-        '-x': False,  # Select only matches that exactly match the whole line.
-        '-o': False,  # Print only the match parts of a matching line
-        '-w': False}  # Select only lines containing matches that form whole words.
+    parsed = __parse_grep_args(args)
+    if parsed is None:
+        return None
+
+    regex, invert, unknown_switches = parsed
+    if unknown_switches and args not in __GREP_REPORTED_ARGS:
+        # parsing is cached, so only report the unsupported switches once
+        __GREP_REPORTED_ARGS.add(args)
+        for switch in unknown_switches:
+            project.logger.error(switch)
+
+    if bool(regex.search(line)) == invert:
+        return None
+    else:
+        return line
+
+
+__GREP_ARGS = re.compile(r'\s*((?:\-\w\s)*)(.*)')
+__GREP_REPORTED_ARGS = set()
+
+# Partial list of supported grep options
+__GREP_OPTIONS = frozenset((
+    '-v',  # Invert the sense of matching
+    '-i',  # Ignore case distinctions in patterns and data
+    '-E',  # Interpret PATTERNS as extended regular expressions.
+    '-e',  # Safe interpretation of pattern starting with "-"
+    '-x',  # Select only matches that exactly match the whole line.
+    '-o',  # Print only the match parts of a matching line
+    '-w'   # Select only lines containing matches that form whole words.
+))
+
+
+@functools.lru_cache(maxsize=256)
+def __parse_grep_args(args: str) -> Optional[Tuple[re.Pattern, bool, Tuple[str, ...]]]:
+    """
+    Parses and compiles the grep arguments.
+
+    Args:
+        args (string): Command line arguments for grep command
+
+    Returns:
+        Tuple of the compiled pattern, if the match is inverted, and the
+        unsupported switches, or None if the arguments cannot be parsed.
+    """
 
     # Split into repeating switches and everything else
-    match = re.match(r'\s*((?:\-\w\s)*)(.*)', args)
+    match = __GREP_ARGS.match(args)
 
     if not match:
         return None
@@ -285,28 +361,24 @@ def grep(project: "Project", args: str, line: str) -> Union[None, str]:
     pattern = match.group(2)
 
     # Split space separated switch string into list
-    switches = match.group(1).strip().split(' ')
-
-    # Find special -e switch update the pattern
-    for i in range(len(switches)):
-        if switches[i] == "-e":
-            if i != (len(switches)):
-                pattern = ' '.join(switches[i + 1:]) + " " + pattern
-                switches = switches[0:i + 1]
-                break
-            options["-e"] = True
-        elif switches[i] in options.keys():
-            options[switches[i]] = True
-        elif switches[i] != '':
-            project.logger.error(switches[i])
+    switches = match.group(1).split()
+
+    # Find special -e switch and move everything after it into the pattern,
+    # when -e is the last switch the pattern is used as is
+    if "-e" in switches:
+        idx = switches.index("-e")
+        pattern = " ".join(switches[idx + 1:] + [pattern])
+        switches = switches[:idx + 1]
+
+    options = {switch for switch in switches if switch in __GREP_OPTIONS}
+    unknown_switches = tuple(switch for switch in switches if switch not in __GREP_OPTIONS)
 
     # REGEX
     # TODO: add all the other optinos
-    match = re.search(rf"({pattern})", line)
-    if bool(match) == bool(options["-v"]):
-        return None
-    else:
-        return line
+    flags = 0
+    if "-i" in options:
+        flags |= re.IGNORECASE
+    return re.compile(rf"({pattern})", flags), "-v" in options, unknown_switches
 
 
 def get_plugins(system: str, name: Optional[str] = None) -> List[Callable]:
@@ -315,17 +387,27 @@ def get_plugins(system: str, name: Optional[str] = None) -> List[Callable]:
     '''
 
     plugins = []
-    discovered_plugins = entry_points(group=f'siliconcompiler.{system}')
-    for plugin in discovered_plugins:
+    for plugin in __get_entry_points(system):
         if name:
             if plugin.name == name:
-                plugins.append(plugin.load())
+                plugins.append(__load_plugin(plugin))
         else:
-            plugins.append(plugin.load())
+            plugins.append(__load_plugin(plugin))
 
     return plugins
 
 
+@functools.lru_cache(maxsize=None)
+def __get_entry_points(system: str) -> Tuple:
+    # scanning the installed distributions is expensive, so only do it once per group
+    return tuple(entry_points(group=f'siliconcompiler.{system}'))
+
+
+@functools.lru_cache(maxsize=None)
+def __load_plugin(plugin) -> Callable:
+    return plugin.load()
+
+
 def truncate_text(text: str, width: int) -> str:
     width = max(width, 5)
 
@@ -338,11 +420,7 @@ def truncate_text(text: str, width: int) -> str:
             break
         keep_end += 1
 
-    while len(text) > width:
-        break_at = len(text) - keep_end - 3
-        text = text[:break_at-1] + '...' + text[break_at+3:]
-
-    return text
+    return text[:width - 3 - keep_end] + '...' + text[len(text) - keep_end:]
 
 
 def get_cores(physical: bool = False) -> int:
@@ -353,7 +431,16 @@ def get_cores(physical: bool = False) -> int:
         physical (boolean): if true, only count physical cores
     '''
 
-    cores = psutil.cpu_count(logical=not physical)
+    cores = None
+    if not physical and hasattr(os, 'sched_getaffinity'):
+        # cores this process is allowed to run on, avoids psutil's cpu scan
+        try:
+            cores = len(os.sched_getaffinity(0))
+        except OSError:
+            pass
+
+    if not cores:
+        cores = psutil.cpu_count(logical=not physical)
 
     if not cores:
         cores = os.cpu_count()
@@ -383,6 +470,9 @@ class FilterDirectories:
         self.abspath = None
         self.project = project
 
+        self.__home = self.__normalize(str(pathlib.Path.home()))
+        self.__builddir = None
+
     @property
     def logger(self) -> logging.Logger:
         return self.project.logger
@@ -391,41 +481,52 @@ class FilterDirectories:
     def builddir(self) -> str:
         return builddir(self.project)
 
-    def filter(self, path: str, files: List[str]) -> List[str]:
-        if pathlib.Path(path) == pathlib.Path.home():
+    @staticmethod
+    def __normalize(path: str) -> str:
+        return os.path.normcase(os.path.normpath(path))
+
+    def filter(self, path: str, files: List[str]) -> Collection[str]:
+        norm_path = self.__normalize(path)
+
+        if norm_path == self.__home:
             # refuse to collect home directory
             self.logger.error(f'Cannot collect user home directory: {path}')
             return files
 
-        if pathlib.Path(path) == pathlib.Path(self.builddir):
+        if self.__builddir is None:
+            self.__builddir = self.__normalize(self.builddir)
+
+        if norm_path == self.__builddir:
             # refuse to collect build directory
             self.logger.error(f'Cannot collect build directory: {path}')
             return files
 
         # do not collect hidden files
-        hidden_files = []
-        # filter out hidden files (unix)
-        hidden_files.extend([f for f in files if f.startswith('.')])
-        # filter out hidden files (windows)
-        try:
-            if hasattr(os.stat_result, 'st_file_attributes'):
-                hidden_files.extend([
-                    f for f in files
-                    if bool(os.stat(os.path.join(path, f)).st_file_attributes &
-                            stat.FILE_ATTRIBUTE_HIDDEN)
-                ])
-        except:  # noqa 722
-            pass
-        # filter out hidden files (macos)
-        try:
-            if hasattr(os.stat_result, 'st_reparse_tag'):
-                hidden_files.extend([
-                    f for f in files
-                    if bool(os.stat(os.path.join(path, f)).st_reparse_tag &
-                            stat.UF_HIDDEN)
-                ])
-        except:  # noqa 722
-            pass
+        hidden_files = set()
+        # windows and macos mark hidden files in the file status
+        has_file_attributes = hasattr(os.stat_result, 'st_file_attributes')
+        has_file_flags = hasattr(os.stat_result, 'st_flags')
+        for f in files:
+            # filter out hidden files (unix)
+            if f.startswith('.'):
+                hidden_files.add(f)
+                continue
+
+            if not has_file_attributes and not has_file_flags:
+                continue
+
+            try:
+                file_stat = os.stat(os.path.join(path, f))
+            except OSError:
+                continue
+
+            if has_file_attributes and \
+                    file_stat.st_file_attributes & stat.FILE_ATTRIBUTE_HIDDEN:
+                # filter out hidden files (windows)
+                hidden_files.add(f)
+            elif has_file_flags and file_stat.st_flags & stat.UF_HIDDEN:
+                # filter out hidden files (macos)
+                hidden_files.add(f)
 
         self.file_count += len(files) - len(hidden_files)
 
@@ -8,7 +8,6 @@ from typing import List, Optional, TYPE_CHECKING
 from siliconcompiler.schema.parametervalue import NodeListValue, NodeSetValue
 from siliconcompiler.utils import FilterDirectories
 from siliconcompiler.utils.paths import collectiondir
-from siliconcompiler.scheduler import SchedulerNode
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 
 if TYPE_CHECKING:
@@ -202,6 +201,9 @@ def archive(project: "Project",
         jobname = histories[0]
         project.logger.warning(f"{org_job} not found in history, picking {jobname}")
 
+    # imported here since the scheduler depends on this module
+    from siliconcompiler.scheduler import SchedulerNode
+
     history = project.history(jobname)
 
     flow = history.get('option', 'flow')
@@ -16,6 +16,19 @@ from siliconcompiler.package import InterProcessLock as dut_ipl
 from siliconcompiler import Project, Design
 
 
+@contextlib.contextmanager
+def _passthrough_lock():
+    yield
+
+
+@pytest.fixture
+def resolver():
+    project = Project("testproj")
+    project.set("option", "cachedir", ".")
+
+    return RemoteResolver("thisname", project, "https://filepath", "ref")
+
+
 def test_init():
     resolver = Resolver("testpath", Project("testproj"), "source://this")
 
@@ -92,24 +105,15 @@ def test_find_resolver_not_found():
         Resolver.find_resolver("nosupport://help.me/file")
 
 
-def test_find_resolver_key():
-    assert Resolver.find_resolver("key://this") is KeyPathResolver
-
-
-def test_find_resolver_file():
-    assert Resolver.find_resolver("file://this") is FileResolver
-
-
-def test_find_resolver_file_dot():
-    assert Resolver.find_resolver(".") is FileResolver
-
-
-def test_find_resolver_file_empty():
-    assert Resolver.find_resolver("/this/path") is FileResolver
-
-
-def test_find_resolver_python():
-    assert Resolver.find_resolver("python://siliconcompiler") is PythonPathResolver
+@pytest.mark.parametrize("source,resolver", [
+    ("key://this", KeyPathResolver),
+    ("file://this", FileResolver),
+    (".", FileResolver),
+    ("/this/path", FileResolver),
+    ("python://siliconcompiler", PythonPathResolver)
+])
+def test_find_resolver(source, resolver):
+    assert Resolver.find_resolver(source) is resolver
 
 
 def test_file_env_var():
@@ -177,25 +181,16 @@ def test_file_env_var_brace_form():
     assert resolver.urlpath == "${THIS_PATH}/hello"
 
 
-def test_cache_id_different_name():
-    res0 = Resolver("testpath0", Project("testproj"), "file://.", reference="ref")
-    res1 = Resolver("testpath1", Project("testproj"), "file://.", reference="ref")
-
-    assert res0.cache_id == res1.cache_id
-
-
-def test_cache_id_different_ref():
-    res0 = Resolver("testpath0", Project("testproj"), "file://.", reference="ref0")
-    res1 = Resolver("testpath1", Project("testproj"), "file://.", reference="ref1")
+@pytest.mark.parametrize("source0,ref0,source1,ref1,same", [
+    ("file://.", "ref", "file://.", "ref", True),
+    ("file://.", "ref0", "file://.", "ref1", False),
+    ("file://test0", "ref", "file://test1", "ref", False)
+])
+def test_cache_id(source0, ref0, source1, ref1, same):
+    res0 = Resolver("testpath0", Project("testproj"), source0, reference=ref0)
+    res1 = Resolver("testpath1", Project("testproj"), source1, reference=ref1)
 
-    assert res0.cache_id != res1.cache_id
-
-
-def test_cache_id_different_source():
-    res0 = Resolver("testpath0", Project("testproj"), "file://test0", reference="ref")
-    res1 = Resolver("testpath1", Project("testproj"), "file://test1", reference="ref")
-
-    assert res0.cache_id != res1.cache_id
+    assert (res0.cache_id == res1.cache_id) is same
 
 
 def test_get_path_new_data(monkeypatch, caplog):
@@ -359,11 +354,7 @@ def test_remote_cache_path():
         mkdir.assert_called_once()
 
 
-def test_remote_cache_path_cache_exist():
-    project = Project("testproj")
-    project.set("option", "cachedir", ".")
-
-    resolver = RemoteResolver("thisname", project, "https://filepath", "ref")
+def test_remote_cache_path_cache_exist(resolver):
     with patch("os.makedirs") as mkdir:
         assert resolver.cache_path == Path(os.path.abspath("thisname-ref-c7a4a1c3dfc3975e"))
         mkdir.assert_not_called()
@@ -391,12 +382,28 @@ def test_remote_sc_lock_file():
         mkdir.assert_called_once()
 
 
-def test_remote_resolve_cached():
+def test_remote_cache_dir_created_once():
     project = Project("testproj")
-    project.set("option", "cachedir", ".")
+    project.set("option", "cachedir", "thispath")
 
     resolver = RemoteResolver("thisname", project, "https://filepath", "ref")
+    with patch("os.makedirs") as mkdir:
+        assert resolver.cache_path == \
+            Path(os.path.abspath("thispath/thisname-ref-c7a4a1c3dfc3975e"))
+        assert resolver.lock_file == \
+            Path(os.path.abspath("thispath/thisname-ref-c7a4a1c3dfc3975e.lock"))
+        assert resolver.sc_lock_file == \
+            Path(os.path.abspath("thispath/thisname-ref-c7a4a1c3dfc3975e.sc_lock"))
+        mkdir.assert_called_once()
 
+    project.set("option", "cachedir", "otherpath")
+    with patch("os.makedirs") as mkdir:
+        assert resolver.cache_path == \
+            Path(os.path.abspath("otherpath/thisname-ref-c7a4a1c3dfc3975e"))
+        mkdir.assert_called_once()
+
+
+def test_remote_resolve_cached(resolver):
     with patch("siliconcompiler.package.RemoteResolver.lock") as lock, \
          patch("siliconcompiler.package.RemoteResolver.check_cache") as check_cache, \
          patch("siliconcompiler.package.RemoteResolver.resolve_remote") as resolve_remote:
@@ -407,12 +414,7 @@ def test_remote_resolve_cached():
         resolve_remote.assert_not_called()
 
 
-def test_remote_resolve():
-    project = Project("testproj")
-    project.set("option", "cachedir", ".")
-
-    resolver = RemoteResolver("thisname", project, "https://filepath", "ref")
-
+def test_remote_resolve(resolver):
     with patch("siliconcompiler.package.RemoteResolver.lock") as lock, \
          patch("siliconcompiler.package.RemoteResolver.check_cache") as check_cache, \
          patch("siliconcompiler.package.RemoteResolver.resolve_remote") as resolve_remote:
@@ -452,12 +454,38 @@ def test_remote_resolve_cached_different_name():
         resolve_remote.assert_not_called()
 
 
-def test_remote_lock():
-    project = Project("testproj")
-    project.set("option", "cachedir", ".")
+def test_remote_get_path_rechecked_per_project_and_after_reset():
+    project0 = Project("testproj")
+    project0.set("option", "cachedir", ".")
+    project1 = Project("testproj")
+    project1.set("option", "cachedir", ".")
+    os.makedirs("thisname-ref-c7a4a1c3dfc3975e")
 
-    resolver = RemoteResolver("thisname", project, "https://filepath", "ref")
+    with patch("siliconcompiler.package.RemoteResolver.lock"), \
+         patch("siliconcompiler.package.RemoteResolver.check_cache") as check_cache, \
+         patch("siliconcompiler.package.RemoteResolver.resolve_remote") as resolve_remote:
+        check_cache.return_value = True
 
+        resolver = RemoteResolver("thisname", project0, "https://filepath", "ref")
+        assert resolver.get_path() == os.path.abspath("thisname-ref-c7a4a1c3dfc3975e")
+        assert resolver.get_path() == os.path.abspath("thisname-ref-c7a4a1c3dfc3975e")
+        assert check_cache.call_count == 1
+
+        # Another project checks the cache itself
+        resolver = RemoteResolver("thisname", project1, "https://filepath", "ref")
+        assert resolver.get_path() == os.path.abspath("thisname-ref-c7a4a1c3dfc3975e")
+        assert check_cache.call_count == 2
+
+        # Resetting the cache forces a fresh check
+        Resolver.reset_cache(project0)
+        check_cache.return_value = False
+        resolver = RemoteResolver("thisname", project0, "https://filepath", "ref")
+        assert resolver.get_path() == os.path.abspath("thisname-ref-c7a4a1c3dfc3975e")
+        assert check_cache.call_count == 3
+        resolve_remote.assert_called_once()
+
+
+def test_remote_lock(resolver):
     with resolver.lock():
         assert os.path.exists(resolver.lock_file)
         assert not os.path.exists(resolver.sc_lock_file)
@@ -466,12 +494,7 @@ def test_remote_lock():
     assert not os.path.exists(resolver.sc_lock_file)
 
 
-def test_remote_lock_after_lock():
-    project = Project("testproj")
-    project.set("option", "cachedir", ".")
-
-    resolver = RemoteResolver("thisname", project, "https://filepath", "ref")
-
+def test_remote_lock_after_lock(resolver):
     with resolver.lock():
         assert os.path.exists(resolver.lock_file)
         assert not os.path.exists(resolver.sc_lock_file)
@@ -523,10 +546,7 @@ def test_remote_lock_within_lock_thread_multiple_tries(monkeypatch):
     assert resolver1.timeout == 10
 
     # Allow filelock to pass
-    @contextlib.contextmanager
-    def dummy_lock():
-        yield
-    monkeypatch.setattr(resolver0, "_RemoteResolver__file_lock", dummy_lock)
+    monkeypatch.setattr(resolver0, "_RemoteResolver__file_lock", _passthrough_lock)
 
     with resolver0.lock():
         class DummyLock:
@@ -569,10 +589,7 @@ def test_remote_lock_within_lock_file(monkeypatch):
     assert resolver1.timeout == 1
 
     # Allow threadlock to pass
-    @contextlib.contextmanager
-    def dummy_lock():
-        yield
-    monkeypatch.setattr(resolver0, "_RemoteResolver__thread_lock", dummy_lock)
+    monkeypatch.setattr(resolver0, "_RemoteResolver__thread_lock", _passthrough_lock)
 
     with resolver0.lock():
         assert os.path.exists(resolver0.lock_file)
@@ -590,12 +607,7 @@ def test_remote_lock_within_lock_file(monkeypatch):
     assert not os.path.exists(resolver0.sc_lock_file)
 
 
-def test_remote_lock_exception():
-    project = Project("testproj")
-    project.set("option", "cachedir", ".")
-
-    resolver = RemoteResolver("thisname", project, "https://filepath", "ref")
-
+def test_remote_lock_exception(resolver):
     with pytest.raises(ValueError):
         with resolver.lock():
             assert os.path.exists(resolver.lock_file)
@@ -613,11 +625,7 @@ def test_remote_lock_exception():
             raise ValueError
 
 
-def test_remote_lock_failed():
-    project = Project("testproj")
-    project.set("option", "cachedir", ".")
-
-    resolver = RemoteResolver("thisname", project, "https://filepath", "ref")
+def test_remote_lock_failed(resolver):
     resolver.set_timeout(1)
 
     with patch("fasteners.InterProcessLock.acquire") as acquire:
@@ -633,12 +641,7 @@ def test_remote_lock_failed():
     assert not os.path.exists(resolver.sc_lock_file)
 
 
-def test_remote_lock_revert_to_file():
-    project = Project("testproj")
-    project.set("option", "cachedir", ".")
-
-    resolver = RemoteResolver("thisname", project, "https://filepath", "ref")
-
+def test_remote_lock_revert_to_file(resolver):
     with patch("fasteners.InterProcessLock.acquire") as acquire:
         def fail_lock(*args, **kwargs):
             raise RuntimeError
@@ -652,12 +655,7 @@ def test_remote_lock_revert_to_file():
     assert not os.path.exists(resolver.sc_lock_file)
 
 
-def test_remote_lock_revert_to_file_failed():
-    project = Project("testproj")
-    project.set("option", "cachedir", ".")
-
-    resolver = RemoteResolver("thisname", project, "https://filepath", "ref")
-
+def test_remote_lock_revert_to_file_failed(resolver):
     with patch("fasteners.InterProcessLock.acquire") as acquire, \
          patch("time.sleep") as sleep:
         def fail_lock(*args, **kwargs):
@@ -672,30 +670,23 @@ def test_remote_lock_revert_to_file_failed():
             with resolver.lock():
                 pass
 
-        assert sleep.call_count == 600
+        assert sleep.call_count == 125
+        assert sum(call.args[0] for call in sleep.call_args_list) == pytest.approx(600)
+        assert max(call.args[0] for call in sleep.call_args_list) == 5
 
     assert not os.path.exists(resolver.lock_file)
     assert os.path.exists(resolver.sc_lock_file)
 
 
-def test_file_resolver_abs_path():
-    resolver = FileResolver("thisname", Project("testproj"), os.path.abspath("test"))
-    assert resolver.resolve() == os.path.abspath("test")
-
-
-def test_file_resolver_with_file():
-    resolver = FileResolver("thisname", Project("testproj"), "file://test")
-    assert resolver.resolve() == os.path.abspath("test")
-
-
-def test_file_resolver_with_abspath():
-    resolver = FileResolver("thisname", Project("testproj"), f"file://{os.path.abspath('../test')}")
-    assert resolver.resolve() == os.path.abspath("../test")
-
-
-def test_file_resolver_with_relpath():
-    resolver = FileResolver("thisname", Project("testproj"), "file://test")
-    assert resolver.resolve() == os.path.abspath("test")
+@pytest.mark.parametrize("scheme,path,abspath", [
+    ("", "test", True),
+    ("file://", "test", False),
+    ("file://", "../test", True)
+])
+def test_file_resolver(scheme, path, abspath):
+    source = os.path.abspath(path) if abspath else path
+    resolver = FileResolver("thisname", Project("testproj"), f"{scheme}{source}")
+    assert resolver.resolve() == os.path.abspath(path)
 
 
 def test_python_path_resolver():
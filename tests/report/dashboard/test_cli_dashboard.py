@@ -2,9 +2,10 @@ import io
 import logging
 import pytest
 import queue
-import random
 import threading
 
+from pathlib import Path
+
 from rich.console import Console, Group
 from rich.table import Table
 from rich.padding import Padding
@@ -23,32 +24,64 @@ from siliconcompiler import NodeStatus
 from siliconcompiler.utils.multiprocessing import MPManager
 
 
+# render_lines never writes to the file, so one console serves every test
+_RENDER_CONSOLE = Console(file=io.StringIO(), width=120)
+
+
+def _render_segments(renderable):
+    """Renders to segments and returns the visible (text, color) pairs of each line"""
+    lines = []
+    for line in _RENDER_CONSOLE.render_lines(renderable, pad=False):
+        lines.append([
+            (segment.text.strip(),
+             segment.style.color.name if segment.style and segment.style.color else None)
+            for segment in line if segment.text.strip()])
+    return lines
+
+
+def _expected_rows(job, log=0):
+    """Returns the expected segments of each job board row, with every other node logging"""
+    rows = []
+    for n, node in enumerate(job.nodes, start=1):
+        if node["status"] in [NodeStatus.SKIPPED]:
+            continue
+        row = [
+            (node["status"].upper(), None),
+            (f"{job.design}/{job.jobname}/{node['step']}/{node['index']}", None)
+        ]
+        if log is not None and n % 2 == 0:
+            row.append((node["log"][log], "bright_black"))
+        rows.append(row)
+    return rows
+
+
 @pytest.fixture
 def fake_console(monkeypatch):
     monkeypatch.setattr(Console, "is_terminal", True)
 
 
-@pytest.fixture(autouse=True)
-def reset_singleton(monkeypatch):
-    class MockManager:
-        def Lock(self):
-            return threading.Lock()
+class _MockManager:
+    def Lock(self):
+        return threading.Lock()
+
+    def Event(self):
+        return threading.Event()
 
-        def Event(self):
-            return threading.Event()
+    def Queue(self):
+        return queue.Queue()
 
-        def Queue(self):
-            return queue.Queue()
+    def dict(self):
+        return {}
 
-        def dict(self):
-            return {}
+    def Namespace(self):
+        class Dummy:
+            pass
+        return Dummy()
 
-        def Namespace(self):
-            class Dummy:
-                pass
-            return Dummy()
 
-    monkeypatch.setattr(MPManager, "get_dashboard", lambda: Board(MockManager()))
+@pytest.fixture(autouse=True)
+def reset_singleton(monkeypatch):
+    monkeypatch.setattr(MPManager, "get_dashboard", lambda: Board(_MockManager()))
 
 
 @pytest.fixture
@@ -58,229 +91,118 @@ def mock_project(asic_gcd):
     return asic_gcd
 
 
-@pytest.fixture
-def mock_running_job_lg():
-    mock_job_data = JobData()
-    mock_job_data.total = 30
-    mock_job_data.design = "design1"
-    mock_job_data.jobname = "job1"
-    statuses = [NodeStatus.SUCCESS, NodeStatus.ERROR, NodeStatus.PENDING]
-    mock_job_data.nodes = [
-        {
-            "step": f"node{index + 1}",
+def _make_job_data(design, jobname, total, statuses, duration=None, with_time=True,
+                   second_log=False):
+    job_data = JobData()
+    job_data.total = total
+    job_data.design = design
+    job_data.jobname = jobname
+    job_data.nodes = []
+    job_data.success = 0
+    job_data.error = 0
+    for index in range(total):
+        step = f"node{index + 1}"
+        status = statuses[index % len(statuses)]
+        node = {
+            "step": step,
             "index": index,
-            "status": statuses[index % len(statuses)],
-            "log": [f"node{index + 1}.log", f"second_node{index + 1}.log"],
+            "status": status,
+            "log": [f"{step}.log", f"second_{step}.log"] if second_log else [f"{step}.log"],
             "metrics": ["", ""],
-            "time": {
-                "duration": None,
-                "start": None
-            },
             "print": {
                 "order": (index, index),
-                "priority": 0 if statuses[index % len(statuses)] == NodeStatus.ERROR else index
+                "priority": 0 if status == NodeStatus.ERROR else index
             }
         }
-        for index in range(mock_job_data.total)
-    ]
-    mock_job_data.success = sum(1 for node in mock_job_data.nodes
-                                if NodeStatus.is_success(node["status"]))
-    mock_job_data.error = sum(1 for node in mock_job_data.nodes
-                              if NodeStatus.is_error(node["status"]))
-    mock_job_data.finished = mock_job_data.success + mock_job_data.error
-    return mock_job_data
+        if with_time:
+            node["time"] = {
+                "duration": duration,
+                "start": None
+            }
+        if NodeStatus.is_success(node["status"]):
+            job_data.success += 1
+        elif NodeStatus.is_error(node["status"]):
+            job_data.error += 1
+        job_data.nodes.append(node)
+    job_data.finished = job_data.success + job_data.error
+    return job_data
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def mock_running_job_lg():
+    return _make_job_data(
+        "design1", "job1", 30,
+        [NodeStatus.SUCCESS, NodeStatus.ERROR, NodeStatus.PENDING],
+        second_log=True)
+
+
+@pytest.fixture(scope="module")
 def mock_running_job_lg_second():
-    mock_job_data = JobData()
-    mock_job_data.total = 30
-    mock_job_data.design = "design2"
-    mock_job_data.jobname = "job2"
-    statuses = [NodeStatus.ERROR, NodeStatus.PENDING, NodeStatus.SUCCESS]
-    mock_job_data.nodes = [
-        {
-            "step": f"node{index + 1}",
-            "index": index,
-            "status": statuses[index % len(statuses)],
-            "log": [f"node{index + 1}.log"],
-            "metrics": ["", ""],
-            "time": {
-                "duration": None,
-                "start": None
-            },
-            "print": {
-                "order": (index, index),
-                "priority": 0 if statuses[index % len(statuses)] == NodeStatus.ERROR else index
-            }
-        }
-        for index in range(mock_job_data.total)
-    ]
-    mock_job_data.success = sum(1 for node in mock_job_data.nodes
-                                if NodeStatus.is_success(node["status"]))
-    mock_job_data.error = sum(1 for node in mock_job_data.nodes
-                              if NodeStatus.is_error(node["status"]))
-    mock_job_data.finished = mock_job_data.success + mock_job_data.error
-    return mock_job_data
+    return _make_job_data(
+        "design2", "job2", 30,
+        [NodeStatus.ERROR, NodeStatus.PENDING, NodeStatus.SUCCESS])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_running_job():
-    mock_job_data = JobData()
-    mock_job_data.total = 5
-    mock_job_data.design = "design1"
-    mock_job_data.jobname = "job1"
-    statuses = [NodeStatus.SUCCESS, NodeStatus.ERROR, NodeStatus.PENDING]
-    mock_job_data.nodes = [
-        {
-            "step": f"node{index + 1}",
-            "index": index,
-            "status": random.choice(statuses),
-            "metrics": ["", ""],
-            "log": [f"node{index + 1}.log"],
-            "print": {
-                "order": (index, index),
-                "priority": 0 if statuses[index % len(statuses)] == NodeStatus.ERROR else index
-            }
-        }
-        for index in range(mock_job_data.total)
-    ]
-    mock_job_data.success = sum(1 for node in mock_job_data.nodes
-                                if NodeStatus.is_success(node["status"]))
-    mock_job_data.error = sum(1 for node in mock_job_data.nodes
-                              if NodeStatus.is_error(node["status"]))
-    mock_job_data.finished = mock_job_data.success + mock_job_data.error
-    return mock_job_data
+    return _make_job_data(
+        "design1", "job1", 5,
+        [NodeStatus.SUCCESS, NodeStatus.ERROR, NodeStatus.PENDING],
+        with_time=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_finished_job_fail():
-    mock_job_data = JobData()
-    mock_job_data.total = 5
-    mock_job_data.design = "design1"
-    mock_job_data.jobname = "job1"
-    statuses = [NodeStatus.SUCCESS, NodeStatus.ERROR]
-    mock_job_data.nodes = [
-        {
-            "step": f"node{index + 1}",
-            "index": index,
-            "status": statuses[index % len(statuses)],
-            "metrics": ["", ""],
-            "log": [f"node{index + 1}.log"],
-            "time": {
-                "duration": 5.0,
-                "start": None
-            },
-            "print": {
-                "order": (index, index),
-                "priority": 0 if statuses[index % len(statuses)] == NodeStatus.ERROR else index
-            }
-        }
-        for index in range(mock_job_data.total)
-    ]
-    mock_job_data.success = sum(1 for node in mock_job_data.nodes
-                                if NodeStatus.is_success(node["status"]))
-    mock_job_data.error = sum(1 for node in mock_job_data.nodes
-                              if NodeStatus.is_error(node["status"]))
-    mock_job_data.finished = mock_job_data.success + mock_job_data.error
-    return mock_job_data
+    return _make_job_data(
+        "design1", "job1", 5,
+        [NodeStatus.SUCCESS, NodeStatus.ERROR],
+        duration=5.0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_finished_job_passed():
-    mock_job_data = JobData()
-    mock_job_data.total = 5
-    mock_job_data.design = "design1"
-    mock_job_data.jobname = "job1"
-    mock_job_data.nodes = [
-        {
-            "step": f"node{index + 1}",
-            "index": index,
-            "status": NodeStatus.SUCCESS,
-            "metrics": ["", ""],
-            "log": [f"node{index + 1}.log"],
-            "time": {
-                "duration": 5.0,
-                "start": None
-            },
-            "print": {
-                "order": (index, index),
-                "priority": index
-            }
-        }
-        for index in range(mock_job_data.total)
-    ]
-    mock_job_data.success = len(mock_job_data.nodes)
-    mock_job_data.error = 0
-    mock_job_data.finished = mock_job_data.success + mock_job_data.error
-    return mock_job_data
+    return _make_job_data(
+        "design1", "job1", 5,
+        [NodeStatus.SUCCESS],
+        duration=5.0)
 
 
 @pytest.fixture
 def dashboard(mock_project, fake_console):
-    with patch("threading.Thread"):
-        dashboard = CliDashboard(mock_project)
-        return dashboard
+    return CliDashboard(mock_project)
 
 
-@pytest.fixture
-def dashboard_xsmall(mock_project, fake_console):
-    with patch("threading.Thread"):
-        dashboard = CliDashboard(mock_project)
-        dashboard._dashboard._console.height = 2
-        dashboard._dashboard._console.width = 120
+def _make_sized_dashboard(project, height, width):
+    dashboard = CliDashboard(project)
+    dashboard._dashboard._console.height = height
+    dashboard._dashboard._console.width = width
 
-        logger = logging.getLogger("test")
-        logger.setLevel(logging.INFO)
+    logger = logging.getLogger("test")
+    logger.setLevel(logging.INFO)
 
-        dashboard.set_logger(logger)
+    dashboard.set_logger(logger)
 
-        return dashboard
+    return dashboard
 
 
 @pytest.fixture
-def dashboard_small(mock_project, fake_console):
-    with patch("threading.Thread"):
-        dashboard = CliDashboard(mock_project)
-        dashboard._dashboard._console.height = 14
-        dashboard._dashboard._console.width = 120
-
-        logger = logging.getLogger("test")
-        logger.setLevel(logging.INFO)
+def dashboard_xsmall(mock_project, fake_console):
+    return _make_sized_dashboard(mock_project, 2, 120)
 
-        dashboard.set_logger(logger)
 
-        return dashboard
+@pytest.fixture
+def dashboard_small(mock_project, fake_console):
+    return _make_sized_dashboard(mock_project, 14, 120)
 
 
 @pytest.fixture
 def dashboard_medium(mock_project, fake_console):
-    with patch("threading.Thread"):
-        dashboard = CliDashboard(mock_project)
-        dashboard._dashboard._console.height = 40
-        dashboard._dashboard._console.width = 200
-
-        logger = logging.getLogger("test")
-        logger.setLevel(logging.INFO)
-
-        dashboard.set_logger(logger)
-
-        return dashboard
+    return _make_sized_dashboard(mock_project, 40, 200)
 
 
 @pytest.fixture
 def dashboard_large(mock_project, fake_console):
-    with patch("threading.Thread"):
-        dashboard = CliDashboard(mock_project)
-        dashboard._dashboard._console.height = 100
-        dashboard._dashboard._console.width = 300
-
-        logger = logging.getLogger("test")
-        logger.setLevel(logging.INFO)
-
-        dashboard.set_logger(logger)
-
-        return dashboard
+    return _make_sized_dashboard(mock_project, 100, 300)
 
 
 def test_init(dashboard):
@@ -296,8 +218,7 @@ def test_init(dashboard):
 def test_no_tty(mock_project, monkeypatch):
     monkeypatch.setattr(Console, "is_terminal", False)
 
-    with patch("threading.Thread"):
-        dashboard = CliDashboard(mock_project)
+    dashboard = CliDashboard(mock_project)
 
     assert not dashboard._dashboard._active
 
@@ -486,16 +407,12 @@ def test_render_log_basic(mock_running_job_lg, dashboard_medium):
     assert log.renderables[0].row_count == 15
 
     # Capture the output
-    io_file = io.StringIO()
-    console = Console(file=io_file, width=120)
-    console.print(log)
-
-    consoleprint = console.file.getvalue().splitlines()
+    consoleprint = _render_segments(log)
     assert len(consoleprint) == 16
-    assert consoleprint[0] == " \x1b[37m| INFO     | first row\x1b[0m  "
-    assert consoleprint[1] == " \x1b[37m| INFO     | second row\x1b[0m "
+    assert consoleprint[0] == [("| INFO     | first row", "white")]
+    assert consoleprint[1] == [("| INFO     | second row", "white")]
     for n in range(2, 16):
-        assert consoleprint[n].strip() == ""  # padding
+        assert consoleprint[n] == []  # padding
 
 
 def test_render_log_truncate(mock_running_job_lg, dashboard_medium):
@@ -508,13 +425,8 @@ def test_render_log_truncate(mock_running_job_lg, dashboard_medium):
 
     dashboard._update_layout()
 
-    logger = logging.getLogger("test")
-    logger.setLevel(logging.INFO)
-
-    dashboard_medium.set_logger(logger)
-
     for i in range(0, 200):
-        logger.log(logging.INFO, f"log row {i}")
+        dashboard._log_handler.add_line(f"log row {i}")
 
     log = dashboard._render_log(dashboard._layout)
     assert isinstance(log.renderables[0], Table)
@@ -523,17 +435,13 @@ def test_render_log_truncate(mock_running_job_lg, dashboard_medium):
     assert log.renderables[0].row_count == dashboard._layout.log_height
 
     # Check content
-    io_file = io.StringIO()
-    console = Console(file=io_file, width=120)
-    console.print(log)
-    actual_output = console.file.getvalue()
-    actual_lines = actual_output.splitlines(keepends=True)
+    actual_lines = _render_segments(log)
     start_index = 200 - dashboard._layout.log_height
     for i, line in enumerate(actual_lines):
         if start_index + i == 200:
-            assert len(line.strip()) == 0
+            assert line == []
         else:
-            assert f"log row {start_index + i}" in line
+            assert line == [(f"log row {start_index + i}", "white")]
 
 
 def test_render_job_dashboard(mock_running_job_lg, dashboard_medium):
@@ -542,8 +450,7 @@ def test_render_job_dashboard(mock_running_job_lg, dashboard_medium):
 
     for n in range(1, mock_running_job_lg.total+1):
         if n % 2 == 0:
-            with open(f"node{n}.log", "w") as f:
-                f.write("test")
+            Path(f"node{n}.log").write_text("test")
 
     with patch.object(Board, "_get_job") as mock_job_data:
         mock_job_data.return_value = mock_running_job_lg
@@ -564,40 +471,9 @@ def test_render_job_dashboard(mock_running_job_lg, dashboard_medium):
     assert job_table.row_count == 19
 
     # Check the content
-    io_file = io.StringIO()
-    console = Console(file=io_file, width=120)
-    logger = logging.getLogger("test")
-    logger.setLevel(logging.INFO)
-    console.print(job_table)
+    actual_lines = _render_segments(job_table)
 
-    # Remove all white spaces
-    actual_output = console.file.getvalue()
-    actual_lines = [
-        line.translate(str.maketrans("", "", " \t\n\r\f\v"))
-        for line in actual_output.splitlines()
-    ]
-
-    expected_lines_all = []
-    for n, node in enumerate(mock_running_job_lg.nodes, start=1):
-        if node["status"] in [NodeStatus.SKIPPED]:
-            continue
-        if n % 2 == 0:
-            log = f'\x1b[90m{node["log"][0]}\x1b[0m'
-        else:
-            log = ""
-        status = node["status"].upper()
-        job_id = "/".join(
-            [
-                mock_running_job_lg.design,
-                mock_running_job_lg.jobname,
-                node["step"],
-                str(node["index"]),
-            ]
-        )
-        div = ""
-        expected_line = f"{status}{div}{job_id}{div}{div}{div}{div}{log}".translate(
-            str.maketrans("", "", " \t\n\r\f\v"))
-        expected_lines_all.append(expected_line)
+    expected_lines_all = _expected_rows(mock_running_job_lg)
 
     actual_lines = actual_lines[2:]
     assert len(actual_lines) == 19
@@ -634,10 +510,8 @@ def test_render_job_dashboard_select_logs(mock_running_job_lg, dashboard_medium)
 
     for n in range(1, mock_running_job_lg.total+1):
         if n % 2 == 0:
-            with open(f"node{n}.log", "w"):
-                pass
-            with open(f"second_node{n}.log", "w") as f:
-                f.write("test")
+            Path(f"node{n}.log").touch()
+            Path(f"second_node{n}.log").write_text("test")
 
     with patch.object(Board, "_get_job") as mock_job_data:
         mock_job_data.return_value = mock_running_job_lg
@@ -658,40 +532,9 @@ def test_render_job_dashboard_select_logs(mock_running_job_lg, dashboard_medium)
     assert job_table.row_count == 19
 
     # Check the content
-    io_file = io.StringIO()
-    console = Console(file=io_file, width=120)
-    logger = logging.getLogger("test")
-    logger.setLevel(logging.INFO)
-    console.print(job_table)
+    actual_lines = _render_segments(job_table)
 
-    # Remove all white spaces
-    actual_output = console.file.getvalue()
-    actual_lines = [
-        line.translate(str.maketrans("", "", " \t\n\r\f\v"))
-        for line in actual_output.splitlines()
-    ]
-
-    expected_lines_all = []
-    for n, node in enumerate(mock_running_job_lg.nodes, start=1):
-        if node["status"] in [NodeStatus.SKIPPED]:
-            continue
-        if n % 2 == 0:
-            log = f'\x1b[90m{node["log"][1]}\x1b[0m'
-        else:
-            log = ""
-        status = node["status"].upper()
-        job_id = "/".join(
-            [
-                mock_running_job_lg.design,
-                mock_running_job_lg.jobname,
-                node["step"],
-                str(node["index"]),
-            ]
-        )
-        div = ""
-        expected_line = f"{status}{div}{job_id}{div}{div}{div}{div}{log}".translate(
-            str.maketrans("", "", " \t\n\r\f\v"))
-        expected_lines_all.append(expected_line)
+    expected_lines_all = _expected_rows(mock_running_job_lg, log=1)
 
     actual_lines = actual_lines[2:]
     assert len(actual_lines) == 19
@@ -728,10 +571,8 @@ def test_render_job_dashboard_select_no_logs(mock_running_job_lg, dashboard_medi
 
     for n in range(1, mock_running_job_lg.total+1):
         if n % 2 == 0:
-            with open(f"node{n}.log", "w"):
-                pass
-            with open(f"second_node{n}.log", "w"):
-                pass
+            Path(f"node{n}.log").touch()
+            Path(f"second_node{n}.log").touch()
 
     with patch.object(Board, "_get_job") as mock_job_data:
         mock_job_data.return_value = mock_running_job_lg
@@ -752,37 +593,9 @@ def test_render_job_dashboard_select_no_logs(mock_running_job_lg, dashboard_medi
     assert job_table.row_count == 19
 
     # Check the content
-    io_file = io.StringIO()
-    console = Console(file=io_file, width=120)
-    logger = logging.getLogger("test")
-    logger.setLevel(logging.INFO)
-    console.print(job_table)
+    actual_lines = _render_segments(job_table)
 
-    # Remove all white spaces
-    actual_output = console.file.getvalue()
-    actual_lines = [
-        line.translate(str.maketrans("", "", " \t\n\r\f\v"))
-        for line in actual_output.splitlines()
-    ]
-
-    expected_lines_all = []
-    for n, node in enumerate(mock_running_job_lg.nodes, start=1):
-        if node["status"] in [NodeStatus.SKIPPED]:
-            continue
-        log = ""
-        status = node["status"].upper()
-        job_id = "/".join(
-            [
-                mock_running_job_lg.design,
-                mock_running_job_lg.jobname,
-                node["step"],
-                str(node["index"]),
-            ]
-        )
-        div = ""
-        expected_line = f"{status}{div}{job_id}{div}{div}{div}{div}{log}".translate(
-            str.maketrans("", "", " \t\n\r\f\v"))
-        expected_lines_all.append(expected_line)
+    expected_lines_all = _expected_rows(mock_running_job_lg, log=None)
 
     actual_lines = actual_lines[2:]
     assert len(actual_lines) == 19
@@ -818,15 +631,10 @@ def test_render_job_dashboard_multi_job(mock_running_job_lg, mock_running_job_lg
     """Test that the job dashboard is created properly"""
     dashboard = dashboard_medium._dashboard
 
-    for n in range(1, mock_running_job_lg.total+1):
-        if n % 2 == 0:
-            with open(f"node{n}.log", "w") as f:
-                f.write("test")
-
-    for n in range(1, mock_running_job_lg_second.total+1):
+    # Both jobs name their logs node<n>.log, so one set of files serves both
+    for n in range(1, max(mock_running_job_lg.total, mock_running_job_lg_second.total)+1):
         if n % 2 == 0:
-            with open(f"node{n}.log", "w") as f:
-                f.write("test")
+            Path(f"node{n}.log").write_text("test")
 
     with patch.object(Board, "_get_job") as mock_job_data:
         mock_job_data.return_value = mock_running_job_lg
@@ -855,62 +663,11 @@ def test_render_job_dashboard_multi_job(mock_running_job_lg, mock_running_job_lg
     assert job_table.row_count == 18
 
     # Check the content
-    io_file = io.StringIO()
-    console = Console(file=io_file, width=120)
-    logger = logging.getLogger("test")
-    logger.setLevel(logging.INFO)
-    console.print(job_table)
+    actual_lines = _render_segments(job_table)
 
-    # Remove all white spaces
-    actual_output = console.file.getvalue()
-    actual_lines = [
-        line.translate(str.maketrans("", "", " \t\n\r\f\v"))
-        for line in actual_output.splitlines()
-    ]
+    expected_lines_all_job1 = _expected_rows(mock_running_job_lg)
 
-    expected_lines_all_job1 = []
-    for n, node in enumerate(mock_running_job_lg.nodes, start=1):
-        if node["status"] in [NodeStatus.SKIPPED]:
-            continue
-        if n % 2 == 0:
-            log = f'\x1b[90m{node["log"][0]}\x1b[0m'
-        else:
-            log = ""
-        status = node["status"].upper()
-        job_id = "/".join(
-            [
-                mock_running_job_lg.design,
-                mock_running_job_lg.jobname,
-                node["step"],
-                str(node["index"]),
-            ]
-        )
-        div = ""
-        expected_line = f"{status}{div}{job_id}{div}{div}{div}{div}{log}".translate(
-            str.maketrans("", "", " \t\n\r\f\v"))
-        expected_lines_all_job1.append(expected_line)
-
-    expected_lines_all_job2 = []
-    for n, node in enumerate(mock_running_job_lg_second.nodes, start=1):
-        if node["status"] in [NodeStatus.SKIPPED]:
-            continue
-        if n % 2 == 0:
-            log = f'\x1b[90m{node["log"][0]}\x1b[0m'
-        else:
-            log = ""
-        status = node["status"].upper()
-        job_id = "/".join(
-            [
-                mock_running_job_lg_second.design,
-                mock_running_job_lg_second.jobname,
-                node["step"],
-                str(node["index"]),
-            ]
-        )
-        div = ""
-        expected_line = f"{status}{div}{job_id}{div}{div}{div}{div}{log}".translate(
-            str.maketrans("", "", " \t\n\r\f\v"))
-        expected_lines_all_job2.append(expected_line)
+    expected_lines_all_job2 = _expected_rows(mock_running_job_lg_second)
 
     actual_lines = actual_lines[2:]
     assert len(actual_lines) == 18
@@ -1008,12 +765,8 @@ def test_get_rendable_small_dashboard_running(mock_running_job_lg, dashboard_sma
         dashboard_small.set_logger(None)
         dashboard._update_render_data(dashboard_small._project)
 
-    logger = logging.getLogger("test")
-    logger.setLevel(logging.INFO)
-    dashboard_small.set_logger(logger)
-
     for i in range(100):
-        logger.log(logging.INFO, f"{i}th row")
+        dashboard._log_handler.add_line(f"| INFO     | {i}th row")
 
     dashboard._update_rendable_data()
     rendable = dashboard._get_rendable()
@@ -1051,12 +804,8 @@ def test_get_rendable_medium_dashboard_running(mock_running_job_lg, dashboard_me
         dashboard_medium.set_logger(None)
         dashboard._update_render_data(dashboard_medium._project)
 
-    logger = logging.getLogger("test")
-    logger.setLevel(logging.INFO)
-    dashboard_medium.set_logger(logger)
-
     for i in range(100):
-        logger.log(logging.INFO, f"{i}th row")
+        dashboard._log_handler.add_line(f"| INFO     | {i}th row")
 
     dashboard._update_rendable_data()
     rendable = dashboard._get_rendable()
@@ -0,0 +1,145 @@
+import ntpath
+import os
+
+from siliconcompiler.report import report
+
+
+def _manifest():
+    return {
+        'option': {
+            'flow': 'asicflow',
+            'input': ['gcd.v', 'gcd.sdc'],
+            'clean': None
+        },
+        'inputnode': {
+            'syn0': 'import'
+        }
+    }
+
+
+def test_search_manifest_no_search():
+    manifest = _manifest()
+    assert report.search_manifest(manifest) is manifest
+
+
+def test_search_manifest_key_literal():
+    assert report.search_manifest(_manifest(), key_search='input') == {
+        'option': {
+            'input': ['gcd.v', 'gcd.sdc']
+        },
+        'inputnode': {
+            'syn0': 'import'
+        }
+    }
+
+
+def test_search_manifest_key_glob_not_wrapped():
+    assert report.search_manifest(_manifest(), key_search='input*') == {
+        'option': {
+            'input': ['gcd.v', 'gcd.sdc']
+        },
+        'inputnode': {
+            'syn0': 'import'
+        }
+    }
+    assert report.search_manifest(_manifest(), key_search='*node') == {
+        'inputnode': {
+            'syn0': 'import'
+        }
+    }
+    assert report.search_manifest(_manifest(), key_search='?lean') == {
+        'option': {
+            'clean': None
+        }
+    }
+
+
+def test_search_manifest_value_literal():
+    assert report.search_manifest(_manifest(), value_search='sdc') == {
+        'option': {
+            'input': ['gcd.v', 'gcd.sdc']
+        }
+    }
+
+
+def test_search_manifest_value_glob_not_wrapped():
+    assert report.search_manifest(_manifest(), value_search='asic*') == {
+        'option': {
+            'flow': 'asicflow'
+        }
+    }
+    assert report.search_manifest(_manifest(), value_search='flow*') == {}
+
+
+def test_search_manifest_key_and_value():
+    assert report.search_manifest(_manifest(), key_search='input', value_search='*.v') == {
+        'option': {
+            'input': ['gcd.v', 'gcd.sdc']
+        }
+    }
+
+
+def test_search_manifest_windows_ignores_case(monkeypatch):
+    monkeypatch.setattr(os, 'name', 'nt')
+    monkeypatch.setattr(os.path, 'normcase', ntpath.normcase)
+
+    assert report.search_manifest(_manifest(), key_search='INPUT') == {
+        'option': {
+            'input': ['gcd.v', 'gcd.sdc']
+        },
+        'inputnode': {
+            'syn0': 'import'
+        }
+    }
+    assert report.search_manifest(_manifest(), value_search='ASIC*') == {
+        'option': {
+            'flow': 'asicflow'
+        }
+    }
+
+
+def test_make_manifest_node_keys(asic_gcd):
+    asic_gcd.set('metric', 'errors', 1, step='syn', index='10')
+    asic_gcd.set('metric', 'errors', 2, step='syn1', index='0')
+    asic_gcd.set('option', 'breakpoint', True, step='syn')
+
+    manifest = report.make_manifest(asic_gcd)
+
+    assert manifest['metric']['errors'] == {
+        'default': None,
+        'syn/10': 1,
+        'syn1/0': 2
+    }
+    assert manifest['option']['breakpoint'] == {
+        'default': False,
+        'syn': True
+    }
+    assert manifest['option']['design'] == 'gcd'
+
+
+def test_get_chart_data_follows_metric_changes(asic_gcd):
+    asic_gcd.set('metric', 'errors', 1, step='elaborate', index='0')
+    projects = [{'project_object': asic_gcd, 'project_name': 'job0'}]
+
+    nodes, metrics = report.get_chart_selection_options(projects)
+    assert 'elaborate/0' in nodes
+    assert 'errors' in metrics
+    assert report.get_chart_data(projects, 'errors', [('elaborate', '0')]) == \
+        ({('elaborate', '0'): {'job0': 1}}, '')
+
+    asic_gcd.set('metric', 'errors', 5, step='elaborate', index='0')
+    assert report.get_chart_data(projects, 'errors', [('elaborate', '0')]) == \
+        ({('elaborate', '0'): {'job0': 5}}, '')
+
+
+def test_get_chart_data_uses_collected_data(asic_gcd):
+    asic_gcd.set('metric', 'errors', 1, step='elaborate', index='0')
+    projects = [{
+        'project_object': asic_gcd,
+        'project_name': 'job0',
+        'chart_data': report.collect_chart_data(asic_gcd)
+    }]
+
+    asic_gcd.set('metric', 'errors', 5, step='elaborate', index='0')
+    assert report.get_chart_data(projects, 'errors', [('elaborate', '0')]) == \
+        ({('elaborate', '0'): {'job0': 1}}, '')
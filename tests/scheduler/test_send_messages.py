@@ -1,7 +1,10 @@
+import email
 import pytest
+import smtplib
 from siliconcompiler.scheduler import send_messages
 from unittest.mock import patch
 from siliconcompiler.utils import default_email_credentials_file
+from siliconcompiler.utils.paths import workdir
 import json
 from pathlib import Path
 import os
@@ -17,6 +20,12 @@ events = (
 )
 
 
+@pytest.fixture(autouse=True)
+def close_smtp_connection():
+    yield
+    send_messages.__close_smtp_connection()
+
+
 @pytest.fixture
 def email_creds(monkeypatch):
     def _mock_home():
@@ -52,7 +61,7 @@ def test_email_all(asic_gcd, email_creds, event):
 
         mock_smtp.assert_called()
 
-        context = mock_smtp.return_value.__enter__.return_value
+        context = mock_smtp.return_value
         context.login.assert_called()
         context.sendmail.assert_called()
 
@@ -69,7 +78,7 @@ def test_email_none(asic_gcd, email_creds, event):
 
         mock_smtp.assert_not_called()
 
-        context = mock_smtp.return_value.__enter__.return_value
+        context = mock_smtp.return_value
         context.login.assert_not_called()
         context.sendmail.assert_not_called()
 
@@ -86,7 +95,7 @@ def test_email_single_match(asic_gcd, email_creds, event, check_event):
 
         mock_smtp.assert_called()
 
-        context = mock_smtp.return_value.__enter__.return_value
+        context = mock_smtp.return_value
         context.login.assert_called()
         context.sendmail.assert_called()
 
@@ -103,7 +112,7 @@ def test_email_single_not_match(asic_gcd, email_creds, event, check_event):
 
         mock_smtp.assert_not_called()
 
-        context = mock_smtp.return_value.__enter__.return_value
+        context = mock_smtp.return_value
         context.login.assert_not_called()
         context.sendmail.assert_not_called()
 
@@ -120,7 +129,7 @@ def test_email_missing_credentials(asic_gcd, event):
 
         mock_smtp.assert_not_called()
 
-        context = mock_smtp.return_value.__enter__.return_value
+        context = mock_smtp.return_value
         context.login.assert_not_called()
         context.sendmail.assert_not_called()
 
@@ -136,7 +145,7 @@ def test_email_missing_email(asic_gcd, email_creds, event):
 
         mock_smtp.assert_not_called()
 
-        context = mock_smtp.return_value.__enter__.return_value
+        context = mock_smtp.return_value
         context.login.assert_not_called()
         context.sendmail.assert_not_called()
 
@@ -152,7 +161,7 @@ def test_email_missing_event(asic_gcd, email_creds, event):
 
         mock_smtp.assert_not_called()
 
-        context = mock_smtp.return_value.__enter__.return_value
+        context = mock_smtp.return_value
         context.login.assert_not_called()
         context.sendmail.assert_not_called()
 
@@ -166,7 +175,7 @@ def test_email_step_index(asic_gcd, email_creds):
 
         mock_smtp.assert_not_called()
 
-        context = mock_smtp.return_value.__enter__.return_value
+        context = mock_smtp.return_value
         context.login.assert_not_called()
         context.sendmail.assert_not_called()
 
@@ -175,6 +184,149 @@ def test_email_step_index(asic_gcd, email_creds):
 
         mock_smtp.assert_called()
 
-        context = mock_smtp.return_value.__enter__.return_value
+        context = mock_smtp.return_value
         context.login.assert_called()
         context.sendmail.assert_called()
+
+
+def test_email_log_tail(asic_gcd, email_creds):
+    with open(email_creds) as f:
+        creds = json.load(f)
+    creds["max_file_size"] = 5
+    with open(email_creds, 'w') as f:
+        json.dump(creds, f)
+
+    asic_gcd.set('option', 'scheduler', 'msgevent', 'all')
+    asic_gcd.set('option', 'scheduler', 'msgcontact', 'test@testing.xyz')
+
+    log_dir = workdir(asic_gcd, step="import", index="0")
+    os.makedirs(log_dir)
+    with open(os.path.join(log_dir, "sc_import_0.log"), 'w') as f:
+        f.write("\n".join(f"line {n}" for n in range(100)))
+
+    with patch('smtplib.SMTP_SSL', autospec=True) as mock_smtp:
+        send_messages.send(asic_gcd, "begin", "import", "0")
+
+        context = mock_smtp.return_value
+        context.sendmail.assert_called_once()
+        msg = email.message_from_string(context.sendmail.call_args[0][2])
+
+    logs = [part for part in msg.walk() if part.get_filename() == "sc_import_0.txt"]
+    assert len(logs) == 1
+    assert logs[0].get_payload(decode=True).decode().splitlines() == [
+        "line 95", "line 96", "line 97", "line 98", "line 99"]
+
+
+def test_email_summary_flowgraph_nodes(asic_gcd, email_creds):
+    asic_gcd.set('option', 'scheduler', 'msgevent', 'summary')
+    asic_gcd.set('option', 'scheduler', 'msgcontact', 'test@testing.xyz')
+
+    with patch('smtplib.SMTP_SSL', autospec=True) as mock_smtp, \
+            patch('siliconcompiler.scheduler.send_messages.RuntimeFlowgraph') as runtime:
+        send_messages.send(asic_gcd, "summary", None, None,
+                           flowgraph_nodes=[("syn", "0")])
+
+        runtime.assert_not_called()
+
+        context = mock_smtp.return_value
+        context.sendmail.assert_called()
+
+
+def test_email_reuse_connection(asic_gcd, email_creds):
+    asic_gcd.set('option', 'scheduler', 'msgevent', 'all')
+    asic_gcd.set('option', 'scheduler', 'msgcontact', 'test@testing.xyz')
+
+    with patch('smtplib.SMTP_SSL', autospec=True) as mock_smtp:
+        context = mock_smtp.return_value
+        context.noop.return_value = (250, b'OK')
+
+        send_messages.send(asic_gcd, "begin", "import", "0")
+        send_messages.send(asic_gcd, "end", "import", "0")
+
+        mock_smtp.assert_called_once()
+        context.login.assert_called_once()
+        context.noop.assert_called_once()
+        assert context.sendmail.call_count == 2
+        context.quit.assert_not_called()
+
+        send_messages.__close_smtp_connection()
+        context.quit.assert_called_once()
+
+
+def test_email_close_connection_in_child_process(asic_gcd, email_creds, monkeypatch):
+    asic_gcd.set('option', 'scheduler', 'msgevent', 'all')
+    asic_gcd.set('option', 'scheduler', 'msgcontact', 'test@testing.xyz')
+
+    # Act as a forked process, which does not run the atexit hook
+    monkeypatch.setattr(send_messages, "__SMTP_POOL_PID", os.getpid() + 1)
+
+    with patch('smtplib.SMTP_SSL', autospec=True) as mock_smtp:
+        context = mock_smtp.return_value
+        context.noop.return_value = (250, b'OK')
+
+        send_messages.send(asic_gcd, "begin", "import", "0")
+        context.quit.assert_called_once()
+
+        send_messages.send(asic_gcd, "end", "import", "0")
+        assert mock_smtp.call_count == 2
+        assert context.quit.call_count == 2
+        assert context.sendmail.call_count == 2
+
+
+def test_email_reconnect_dropped_connection(asic_gcd, email_creds):
+    asic_gcd.set('option', 'scheduler', 'msgevent', 'all')
+    asic_gcd.set('option', 'scheduler', 'msgcontact', 'test@testing.xyz')
+
+    with patch('smtplib.SMTP_SSL', autospec=True) as mock_smtp:
+        context = mock_smtp.return_value
+        context.noop.side_effect = smtplib.SMTPServerDisconnected
+
+        send_messages.send(asic_gcd, "begin", "import", "0")
+        send_messages.send(asic_gcd, "end", "import", "0")
+
+        assert mock_smtp.call_count == 2
+        assert context.login.call_count == 2
+        assert context.sendmail.call_count == 2
+
+
+def test_email_login_failed(asic_gcd, email_creds):
+    asic_gcd.set('option', 'scheduler', 'msgevent', 'all')
+    asic_gcd.set('option', 'scheduler', 'msgcontact', 'test@testing.xyz')
+
+    with patch('smtplib.SMTP_SSL', autospec=True) as mock_smtp:
+        context = mock_smtp.return_value
+        context.login.side_effect = smtplib.SMTPAuthenticationError(535, b'failed')
+
+        send_messages.send(asic_gcd, "begin", "import", "0")
+
+        context.sendmail.assert_not_called()
+        context.quit.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    'content,encoding', [
+        ("line 0\nline 1", "7bit"),
+        ("line 0\nline \u00e9", "base64"),
+        ("line 0\n" + "x" * 1000, "base64")
+    ]
+)
+def test_email_log_encoding(asic_gcd, email_creds, content, encoding):
+    asic_gcd.set('option', 'scheduler', 'msgevent', 'all')
+    asic_gcd.set('option', 'scheduler', 'msgcontact', 'test@testing.xyz')
+
+    log_dir = workdir(asic_gcd, step="import", index="0")
+    os.makedirs(log_dir)
+    with open(os.path.join(log_dir, "sc_import_0.log"), 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    with patch('smtplib.SMTP_SSL', autospec=True) as mock_smtp:
+        send_messages.send(asic_gcd, "begin", "import", "0")
+
+        context = mock_smtp.return_value
+        msg = email.message_from_string(context.sendmail.call_args[0][2])
+
+    logs = [part for part in msg.walk() if part.get_filename() == "sc_import_0.txt"]
+    assert len(logs) == 1
+    assert logs[0].get_content_type() == "text/plain"
+    assert logs[0]["Content-Transfer-Encoding"] == encoding
+    assert logs[0].get_payload(decode=True).decode() == content
@@ -1,9 +1,10 @@
+import gzip
 import json
 import pytest
 
 from siliconcompiler.schema import BaseSchema
 from siliconcompiler.schema import EditableSchema
-from siliconcompiler.schema import Parameter
+from siliconcompiler.schema import Parameter, PerNode
 from siliconcompiler.schema import Journal
 
 
@@ -27,6 +28,27 @@ def test_is_journaling():
     assert journal.is_journaling() is False
 
 
+def test_len():
+    journal = Journal()
+    child = journal.get_child("test0")
+    assert len(journal) == 0
+    assert journal.is_empty()
+
+    journal.start()
+    assert len(journal) == 0
+    assert journal.is_empty()
+
+    child.record("set", ["test1"], "hello")
+    assert len(journal) == 1
+    assert len(child) == 1
+    assert not journal.is_empty()
+    assert not child.is_empty()
+
+    journal.stop()
+    assert len(journal) == 0
+    assert journal.is_empty()
+
+
 def test_has_journaling():
     journal = Journal()
     journal.start()
@@ -119,6 +141,32 @@ def test_get_no_journal():
     assert journal.get() is None
 
 
+def test_record_follows_types():
+    journal = Journal()
+    child = journal.get_child("test0")
+    journal.start()
+
+    journal.remove_type("set")
+    child.record("set", ["test1"], "hello")
+    child.record("add", ["test1"], "hello")
+    assert [record["type"] for record in journal.get()] == ["add"]
+
+    journal.stop()
+    child.record("add", ["test1"], "hello")
+    assert journal.get() is None
+
+    journal.start()
+    child.record("set", ["test1"], "hello")
+    assert journal.get() == [{
+        "type": "set",
+        "key": ("test0", "test1"),
+        "value": "hello",
+        "field": None,
+        "step": None,
+        "index": None
+    }]
+
+
 def test_get():
     journal = Journal()
     journal.start()
@@ -137,6 +185,26 @@ def test_get():
     }]
 
 
+def test_get_returns_copy():
+    journal = Journal()
+    journal.start()
+
+    journal.record("set", ["test0", "test1"], ["hello", ["world"]], field="value")
+    data = journal.get()
+    data[0]["field"] = "help"
+    data[0]["value"].append("extra")
+    data[0]["value"][1].append("extra")
+
+    assert journal.get() == [{
+        "type": "set",
+        "key": ("test0", "test1"),
+        "value": ["hello", ["world"]],
+        "field": "value",
+        "step": None,
+        "index": None
+    }]
+
+
 def test_set():
     journal = Journal()
     journal.start()
@@ -340,7 +408,7 @@ def test_replay_schema():
     assert schema.get("test0", "test1") == "hello"
     assert check_schema.get("test0", "test1") is None
 
-    assert len(journal.get()) == 2
+    assert len(journal) == 2
 
     journal.replay(check_schema)
     assert check_schema.get("test0", "test1") == "hello"
@@ -374,16 +442,69 @@ def test_replay_all_types():
     ])
 
 
+def test_replay_skips_superseded_set():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", Parameter("str"))
+    edit.insert("test1", "default", Parameter("[str]"))
+
+    check_schema = schema.copy()
+
+    journal = Journal.access(schema)
+    journal.start()
+
+    assert schema.set("test0", "test1", "hello0")
+    assert schema.set("test1", "test1", "hello1")
+    assert schema.set("test0", "test1", "hello2")
+    assert schema.set("test1", "test1", "hello3")
+    assert schema.add("test1", "test1", "hello4")
+
+    check_journal = Journal.access(check_schema)
+    check_journal.start()
+    journal.replay(check_schema)
+
+    assert check_schema.get("test0", "test1") == "hello2"
+    assert check_schema.get("test1", "test1") == ["hello3", "hello4"]
+    assert [(record["key"], record["value"]) for record in check_journal.get()] == [
+        (("test0", "test1"), "hello2"),
+        (("test1", "test1"), "hello3"),
+        (("test1", "test1"), "hello4")
+    ]
+
+
+def test_replay_keeps_set_before_other_access():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", Parameter("[str]", pernode=PerNode.OPTIONAL))
+
+    check_schema = schema.copy()
+
+    journal = Journal.access(schema)
+    journal.start()
+
+    assert schema.set("test0", "test1", "hello0")
+    assert schema.add("test0", "test1", "hello1")
+    assert schema.set("test0", "test1", "hello2", step="step", index="0")
+    assert schema.set("test0", "test1", "hello3")
+
+    check_journal = Journal.access(check_schema)
+    check_journal.start()
+    journal.replay(check_schema)
+
+    assert check_schema.get("test0", "test1") == ["hello3"]
+    assert len(check_journal) == 4
+
+
 def test_replay_invalid_type():
     journal = Journal()
-    journal._Journal__journal = [{
+    journal.from_dict([{
         "type": "notanoption",
         "key": ("test0", "test1"),
         "value": "hello",
         "field": "value",
         "step": None,
         "index": None
-    }]
+    }])
 
     with pytest.raises(ValueError, match="^Unknown record type notanoption$"):
         journal.replay(BaseSchema())
@@ -414,7 +535,7 @@ def test_forward_exception_with_key_set_replay(error, monkeypatch):
     monkeypatch.setattr(param, 'set', dummy_set)
 
     journal = Journal()
-    journal._Journal__journal = [
+    journal.from_dict([
         {
             "type": "set",
             "key": ("test0", "test1"),
@@ -423,7 +544,7 @@ def test_forward_exception_with_key_set_replay(error, monkeypatch):
             "step": None,
             "index": None
         }
-    ]
+    ])
 
     with pytest.raises(error,
                        match=r"^error while setting \[test0,test1\]: "
@@ -443,7 +564,7 @@ def test_forward_exception_with_key_add_replay(error, monkeypatch):
     monkeypatch.setattr(param, 'add', dummy_add)
 
     journal = Journal()
-    journal._Journal__journal = [
+    journal.from_dict([
         {
             "type": "add",
             "key": ("test0", "test1"),
@@ -452,7 +573,7 @@ def test_forward_exception_with_key_add_replay(error, monkeypatch):
             "step": None,
             "index": None
         }
-    ]
+    ])
 
     with pytest.raises(error,
                        match=r"^error while adding to \[test0,test1\]: "
@@ -484,6 +605,29 @@ def test_replay_file():
     assert schema.get("test0", "test1") == ["hello"]
 
 
+def test_replay_file_gzip():
+    replay = [
+        {
+            "type": "add",
+            "key": ("test0", "test1"),
+            "value": "hello",
+            "field": "value",
+            "step": None,
+            "index": None
+        }
+    ]
+    with gzip.open("replay.json.gz", "wt") as f:
+        json.dump({"__journal__": replay}, f)
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    param = Parameter("[str]")
+    edit.insert("test0", "test1", param)
+
+    Journal.replay_file(schema, "replay.json.gz")
+    assert schema.get("test0", "test1") == ["hello"]
+
+
 def test_replay_file_empty():
     with open("replay.json", "w") as f:
         json.dump({}, f)
@@ -0,0 +1,44 @@
+import pytest
+import subprocess
+import sys
+
+import siliconcompiler
+
+
+def test_lazy_imports_fresh_interpreter():
+    # Check in a new interpreter so every name goes through the lazy lookup
+    script = '''
+import importlib
+import siliconcompiler
+
+names = dir(siliconcompiler)
+for name, module in siliconcompiler._LAZY_IMPORTS.items():
+    assert name in names, name
+    assert name not in vars(siliconcompiler), name
+    value = getattr(siliconcompiler, name)
+    assert value is getattr(importlib.import_module(module), name), name
+    assert vars(siliconcompiler)[name] is value, name
+print("ok")
+'''
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "ok"
+
+
+@pytest.mark.parametrize("module", sorted(set(siliconcompiler._LAZY_IMPORTS.values())))
+def test_lazy_module_imports_first(module):
+    # Importing a class module before the package must not hit a circular import
+    proc = subprocess.run([sys.executable, "-c", f"import {module}"],
+                          capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_lazy_imports_listed():
+    assert set(siliconcompiler._LAZY_IMPORTS).issubset(dir(siliconcompiler))
+    assert set(siliconcompiler._LAZY_IMPORTS).issubset(siliconcompiler.__all__)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError,
+                       match="module 'siliconcompiler' has no attribute 'NotAClass'"):
+        siliconcompiler.NotAClass
@@ -1623,6 +1623,20 @@ def test_get_files_from_input_nodes_multiple(running_node):
         }
 
 
+def test_get_files_from_input_nodes_returns_copy(running_node):
+    running_node.project.set("tool", "builtin", "task", "nop", "output", "file0.txt",
+                             step="running", index="0")
+
+    with running_node.task.runtime(running_node.switch_node("notrunning", "0")) as \
+            runtool:
+        files = runtool.get_files_from_input_nodes()
+        files['file0.txt'].append(('other', '0'))
+        files['file1.txt'] = [('other', '0')]
+        assert runtool.get_files_from_input_nodes() == {
+            'file0.txt': [('running', '0')]
+        }
+
+
 def test_add_required_key(running_node):
     with running_node.task.runtime(running_node) as runtool:
         assert runtool.add_required_key("this", "key", "is", "required")
@@ -272,3 +272,77 @@ def test_convert_drc(setup_pdk_test, datadir):
 
     assert hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest() == \
         '6ee3d048a257ccb7f2c0e86333b2044d0173c5c0'
+
+
+@pytest.fixture
+def gds_export(monkeypatch, datadir):
+    pya = pytest.importorskip("pya")
+    monkeypatch.syspath_prepend(os.path.join(os.path.dirname(export.__file__), "scripts"))
+    from klayout_export import gds_export
+
+    tech = pya.Technology()
+    options = tech.load_layout_options
+    options.lefdef_config.lef_files = [os.path.join(datadir, "klayout_export", "macros.lef")]
+    options.lefdef_config.read_lef_with_def = False
+    options.lefdef_config.macro_resolution_mode = 1
+    options.lefdef_config.dbu = 0.001
+    options.lefdef_config.map_file = os.path.join(datadir, "klayout_export", "layers.map")
+    tech.load_layout_options = options
+
+    def run(in_files, out_file="top.gds"):
+        gds_export("top", os.path.join(datadir, "klayout_export", "top.def"), in_files,
+                   out_file, tech, [], timestamps=False)
+
+        layout = pya.Layout()
+        layout.read(out_file)
+        return layout
+
+    return run
+
+
+def write_macro_gds(filename, dbu, cells):
+    import pya
+
+    layout = pya.Layout()
+    layout.dbu = dbu
+    for name, layer in cells.items():
+        cell = layout.create_cell(name)
+        cell.shapes(layout.layer(layer, 0)).insert(pya.DBox(0, 0, 1, 1))
+    layout.write(filename)
+
+
+def test_gds_export_macro_dbu(gds_export):
+    write_macro_gds("inv.gds", 0.001, {"INV": 10})
+    write_macro_gds("buf.gds", 0.0005, {"BUF": 11})
+
+    layout = gds_export(["inv.gds", "buf.gds"])
+
+    assert layout.dbu == 0.001
+    inv = layout.cell("INV").dbbox_per_layer(layout.find_layer(10, 0))
+    buf = layout.cell("BUF").dbbox_per_layer(layout.find_layer(11, 0))
+    assert inv.to_s() == buf.to_s() == "(0,0;1,1)"
+
+
+def test_gds_export_duplicate_macro(gds_export, capsys):
+    write_macro_gds("lib0.gds", 0.001, {"INV": 10, "BUF": 11})
+    write_macro_gds("lib1.gds", 0.001, {"INV": 12})
+
+    layout = gds_export(["lib0.gds", "lib1.gds"])
+
+    assert "[WARNING] Duplicate cell 'INV' in lib1.gds, keeping the one from lib0.gds" in \
+        capsys.readouterr().out
+    assert layout.find_layer(10, 0) is not None
+    assert layout.find_layer(12, 0) is None
+    assert sorted(cell.name for cell in layout.each_cell() if cell.name.startswith("INV")) == \
+        ["INV"]
+
+
+def test_gds_export_written_cells_and_layers(gds_export):
+    write_macro_gds("lib.gds", 0.001, {"INV": 10, "BUF": 11, "UNUSED": 12})
+
+    layout = gds_export(["lib.gds"], out_file="top.oas")
+
+    assert sorted(cell.name for cell in layout.each_cell()) == ["BUF", "INV", "top"]
+    assert not any(cell.is_proxy() for cell in layout.each_cell())
+    assert sorted(layout.get_info(layer).to_s() for layer in layout.layer_indexes()) == \
+        ["10/0", "11/0", "M1.PIN (1/2)", "OUTLINE (2/0)"]
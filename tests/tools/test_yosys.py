@@ -1,5 +1,6 @@
 import pytest
 
+import json
 import os.path
 
 from siliconcompiler.targets import freepdk45_demo
@@ -125,3 +126,37 @@ def test_wildebeest_is_run(heartbeat_design):
 
     assert found, "wildebeest yosys plugin was not run (log file "\
         "did not contain expected execution message)"
+
+
+@pytest.mark.parametrize("stat,metrics", [
+    (None, None),
+    ({"design": {"num_cells": 3, "num_cells_by_type": {"$lut": 2, "dff": 1}}},
+     {"cells": 3, "luts": 2, "registers": 0}),
+])
+def test_fpga_synthesis_post_process(heartbeat_design, stat, metrics):
+    proj = FPGA(heartbeat_design)
+    proj.add_fileset('rtl')
+
+    flow = Flowgraph("synth")
+    flow.node("synthesis", FPGASynthesis())
+    proj.set_flow(flow)
+
+    proj.set_fpga(DummyYosysFPGA())
+
+    node = SchedulerNode(proj, step='synthesis', index='0')
+    with node.runtime():
+        os.makedirs("reports")
+        with open(node.task.get_logpath("exe"), "w") as f:
+            f.write("yosys log\n")
+
+        if stat is None:
+            with pytest.raises(FileNotFoundError, match="reports/stat.json"):
+                node.task.post_process()
+            return
+
+        with open("reports/stat.json", "w") as f:
+            json.dump(stat, f)
+        node.task.post_process()
+
+    for metric, value in metrics.items():
+        assert proj.get("metric", metric, step="synthesis", index="0") == value
@@ -1,8 +1,16 @@
+import errno
+import os
 import pytest
+import stat
 
+from pathlib import Path
+
+from siliconcompiler import Project
 from siliconcompiler.utils import \
     truncate_text, safecompare, get_cores, \
-    get_plugins
+    get_plugins, get_file_template, get_file_ext, grep, \
+    default_credentials_file, default_cache_dir, default_email_credentials_file, \
+    link_copy, link_symlink_copy, FilterDirectories
 
 
 @pytest.mark.parametrize("text", (
@@ -45,6 +53,8 @@ def test_truncate_text():
     assert truncate_text("testing-without-numbers0", 1) == "t...0"
     assert truncate_text("testing-without-numbers9123", 1) == "...23"
 
+    assert truncate_text("a" * 100000 + "12", 10) == "aaaaa...12"
+
 
 @pytest.mark.parametrize("a,op,b,expect", [
     (1, ">", 2, False),
@@ -82,6 +92,7 @@ def test_get_cores_logical(monkeypatch):
         assert logical
         return 2
 
+    monkeypatch.delattr(os, 'sched_getaffinity', raising=False)
     monkeypatch.setattr(psutil, 'cpu_count', cpu_count)
     assert get_cores() == 2
 
@@ -97,6 +108,29 @@ def test_get_cores_physical(monkeypatch):
     assert get_cores(physical=True) == 2
 
 
+def test_get_cores_affinity(monkeypatch):
+    import psutil
+
+    def cpu_count(logical):
+        assert False, "psutil should not be used"
+
+    monkeypatch.setattr(os, 'sched_getaffinity', lambda pid: {0, 1, 2}, raising=False)
+    monkeypatch.setattr(psutil, 'cpu_count', cpu_count)
+    assert get_cores() == 3
+
+
+def test_get_cores_affinity_ignored_for_physical(monkeypatch):
+    import psutil
+
+    def cpu_count(logical):
+        assert not logical
+        return 2
+
+    monkeypatch.setattr(os, 'sched_getaffinity', lambda pid: {0, 1, 2}, raising=False)
+    monkeypatch.setattr(psutil, 'cpu_count', cpu_count)
+    assert get_cores(physical=True) == 2
+
+
 def test_get_cores_use_os(monkeypatch):
     import psutil
     import os
@@ -107,6 +141,7 @@ def test_get_cores_use_os(monkeypatch):
     def os_cpu_count():
         return 6
 
+    monkeypatch.delattr(os, 'sched_getaffinity', raising=False)
     monkeypatch.setattr(psutil, 'cpu_count', psutil_cpu_count)
     monkeypatch.setattr(os, 'cpu_count', os_cpu_count)
     assert get_cores() == 6
@@ -123,6 +158,7 @@ def test_get_cores_use_os_one_core(monkeypatch):
     def os_cpu_count():
         return 1
 
+    monkeypatch.delattr(os, 'sched_getaffinity', raising=False)
     monkeypatch.setattr(psutil, 'cpu_count', psutil_cpu_count)
     monkeypatch.setattr(os, 'cpu_count', os_cpu_count)
     assert get_cores() == 1
@@ -139,15 +175,269 @@ def test_get_cores_fallback(monkeypatch):
     def os_cpu_count():
         return None
 
+    monkeypatch.delattr(os, 'sched_getaffinity', raising=False)
     monkeypatch.setattr(psutil, 'cpu_count', psutil_cpu_count)
     monkeypatch.setattr(os, 'cpu_count', os_cpu_count)
     assert get_cores() == 1
     assert get_cores(physical=True) == 1
 
 
+def test_get_plugins_discovers_once(monkeypatch):
+    from siliconcompiler import utils
+
+    calls = []
+
+    def entry_points(group):
+        calls.append(group)
+        return []
+
+    monkeypatch.setattr(utils, "entry_points", entry_points)
+
+    assert get_plugins("discoveronce") == []
+    assert get_plugins("discoveronce", name="test") == []
+    assert calls == ["siliconcompiler.discoveronce"]
+
+
 def test_get_plugin():
     assert [] == get_plugins("nothingtofind")
     assert len(get_plugins("showtask")) > 0
     assert len(get_plugins("path_resolver")) > 0
 
     assert len(get_plugins("path_resolver", "https")) == 1
+
+
+def test_get_file_template_reuses_template():
+    template = get_file_template('replay/setup.sh')
+    assert get_file_template('replay/setup.sh') is template
+
+
+def test_get_file_template_abspath():
+    with open("test.j2", "w") as f:
+        f.write("hello {{ name }}")
+
+    template = get_file_template(os.path.abspath("test.j2"))
+    assert template.render(name="world") == "hello world"
+
+
+def test_get_file_template_abspath_reload():
+    with open("test.j2", "w") as f:
+        f.write("hello {{ name }}")
+    os.utime("test.j2", (0, 0))
+
+    assert get_file_template(os.path.abspath("test.j2")).render(name="world") == "hello world"
+
+    with open("test.j2", "w") as f:
+        f.write("goodbye {{ name }}")
+    os.utime("test.j2", (10, 10))
+
+    assert get_file_template(os.path.abspath("test.j2")).render(name="world") == \
+        "goodbye world"
+
+
+def test_get_file_template_no_disk_cache(monkeypatch):
+    os.makedirs("home")
+    monkeypatch.setattr(Path, 'home', lambda: Path(os.path.abspath("home")))
+
+    with open("test.j2", "w") as f:
+        f.write("hello {{ name }}")
+
+    assert get_file_template(os.path.abspath("test.j2")).render(name="world") == "hello world"
+    assert os.listdir("home") == []
+
+
+def test_get_file_template_relative_root(monkeypatch):
+    for name in ("first", "second"):
+        os.makedirs(os.path.join(name, "templates"))
+        with open(os.path.join(name, "templates", "test.j2"), "w") as f:
+            f.write(f"{name} {{{{ name }}}}")
+
+    monkeypatch.chdir("first")
+    assert get_file_template("test.j2", root="templates").render(name="world") == "first world"
+
+    monkeypatch.chdir(os.path.join("..", "second"))
+    assert get_file_template("test.j2", root="templates").render(name="world") == "second world"
+
+
+@pytest.mark.parametrize("filename,expect", [
+    ("file.v", "v"),
+    ("FILE.SV", "sv"),
+    ("file.v.gz", "v"),
+    ("file.V.GZ", "v"),
+    ("path.d/file", ""),
+    ("path/.hidden", ""),
+    ("path/.hidden.v", "v"),
+    ("file.gz", ""),
+    ("noext", "")
+])
+def test_get_file_ext(filename, expect):
+    assert get_file_ext(filename) == expect
+
+
+@pytest.mark.parametrize("args,line,expect", [
+    ("ERROR", "ERROR: something", "ERROR: something"),
+    ("ERROR", "error: something", None),
+    ("-i ERROR", "error: something", "error: something"),
+    ("-v DPL", "DPL-0001", None),
+    ("-v DPL", "GRT-0001", "GRT-0001"),
+    ("-e -DPL", "GRT-DPL", "GRT-DPL"),
+    ("-e DPL", "DPL-0001", "DPL-0001"),
+    ("-e DPL", "GRT-0001", None),
+    ("-e -DPL", "GRT DPL", None),
+    ("-v -e -DPL", "GRT-DPL", None),
+    ("ERROR", None, None)
+])
+def test_grep(args, line, expect):
+    assert grep(Project(), args, line) == expect
+
+
+def test_grep_unknown_switch(caplog):
+    project = Project()
+    project.logger.addHandler(caplog.handler)
+
+    assert grep(project, "-q ERROR", "ERROR") == "ERROR"
+    assert grep(project, "-q ERROR", "ERROR") == "ERROR"
+    assert caplog.text.count("-q") == 1
+
+    # a different argument string is reported again
+    assert grep(project, "-q WARNING", "WARNING") == "WARNING"
+    assert caplog.text.count("-q") == 2
+
+
+def test_default_sc_paths_follow_home(monkeypatch):
+    assert default_credentials_file() == os.path.join(Path.home(), '.sc', 'credentials')
+
+    monkeypatch.setattr(Path, 'home', lambda: Path('newhome'))
+    assert default_credentials_file() == os.path.join('newhome', '.sc', 'credentials')
+    assert default_cache_dir() == os.path.join('newhome', '.sc', 'cache')
+    assert default_email_credentials_file() == os.path.join('newhome', '.sc', 'email.json')
+
+
+@pytest.mark.parametrize("copy", (link_copy, link_symlink_copy))
+def test_link_cross_device_skips_link(monkeypatch, copy):
+    link_calls = []
+
+    def link(src, dst):
+        link_calls.append(src)
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "link", link)
+
+    os.makedirs(f"src_{copy.__name__}")
+    os.makedirs(f"dst_{copy.__name__}")
+    for n in range(3):
+        src = os.path.abspath(os.path.join(f"src_{copy.__name__}", f"{n}.txt"))
+        with open(src, "w") as f:
+            f.write(str(n))
+        copy(src, os.path.join(f"dst_{copy.__name__}", f"{n}.txt"))
+        with open(os.path.join(f"dst_{copy.__name__}", f"{n}.txt")) as f:
+            assert f.read() == str(n)
+
+    assert len(link_calls) == 1
+
+
+def test_link_cross_device_relative_paths_after_chdir(monkeypatch):
+    link_calls = []
+
+    def link(src, dst):
+        link_calls.append(src)
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "link", link)
+
+    for cwd in ("first", "second"):
+        os.makedirs(os.path.join(cwd, "src"))
+        os.makedirs(os.path.join(cwd, "dst"))
+        monkeypatch.chdir(cwd)
+        with open(os.path.join("src", "0.txt"), "w") as f:
+            f.write(cwd)
+        link_copy(os.path.join("src", "0.txt"), os.path.join("dst", "0.txt"))
+        with open(os.path.join("dst", "0.txt")) as f:
+            assert f.read() == cwd
+        monkeypatch.chdir("..")
+
+    # the same relative directories are different directories after a chdir
+    assert len(link_calls) == 2
+
+
+def test_link_copy_retries_link_on_other_errors(monkeypatch):
+    link_calls = []
+
+    def link(src, dst):
+        link_calls.append(src)
+        raise OSError(errno.EPERM, "Operation not permitted")
+
+    monkeypatch.setattr(os, "link", link)
+
+    os.makedirs("src")
+    os.makedirs("dst")
+    for n in range(3):
+        src = os.path.join("src", f"{n}.txt")
+        with open(src, "w") as f:
+            f.write(str(n))
+        link_copy(src, os.path.join("dst", f"{n}.txt"))
+        assert os.path.isfile(os.path.join("dst", f"{n}.txt"))
+
+    assert len(link_calls) == 3
+
+
+@pytest.mark.parametrize("copy", (link_copy, link_symlink_copy))
+def test_link_existing_same_file(monkeypatch, copy):
+    with open("src.txt", "w") as f:
+        f.write("src")
+    os.link("src.txt", "dst.txt")
+
+    def link(src, dst):
+        assert False, "link should not be attempted"
+
+    monkeypatch.setattr(os, "link", link)
+
+    copy(os.path.abspath("src.txt"), os.path.abspath("dst.txt"))
+    assert os.path.samefile("src.txt", "dst.txt")
+
+
+@pytest.mark.parametrize("copy", (link_copy, link_symlink_copy))
+def test_link_existing_different_file(monkeypatch, copy):
+    with open("src.txt", "w") as f:
+        f.write("src")
+    with open("dst.txt", "w") as f:
+        f.write("dst")
+
+    def link(src, dst):
+        assert False, "link should not be attempted"
+
+    monkeypatch.setattr(os, "link", link)
+
+    copy(os.path.abspath("src.txt"), os.path.abspath("dst.txt"))
+    with open("dst.txt") as f:
+        assert f.read() == "src"
+
+
+def test_filter_directories_hidden_files_macos(monkeypatch):
+    os.makedirs("test")
+    for name in ("visible.v", "hidden.v", ".dot.v"):
+        with open(os.path.join("test", name), "w") as f:
+            f.write("test")
+
+    filter = FilterDirectories(Project())
+
+    class StatResult:
+        st_flags = 0
+
+    real_stat = os.stat
+
+    def mock_stat(path, *args, **kwargs):
+        file_stat = real_stat(path, *args, **kwargs)
+        if os.path.dirname(path) != "test":
+            return file_stat
+        result = StatResult()
+        if os.path.basename(path) == "hidden.v":
+            result.st_flags = stat.UF_HIDDEN
+        return result
+
+    # Only macos has st_flags, UF_HIDDEN marks the file as hidden
+    monkeypatch.setattr(os, "stat_result", StatResult)
+    monkeypatch.setattr(os, "stat", mock_stat)
+
+    assert filter.filter("test", ["visible.v", "hidden.v", ".dot.v", "missing.v"]) == \
+        {"hidden.v", ".dot.v"}
+    assert filter.file_count == 2